@@ -2,7 +2,6 @@
 """Enhanced ingestion with comprehensive metadata extraction."""
 
 import argparse
-import hashlib
 import json
 import logging
 import shutil
@@ -17,7 +16,8 @@ from src.config import CHROMA_DB_PATH, OPENAI_API_KEY, PROJECT_ROOT
 from src.logger import setup_logger
 from src.legal_processor import LegalDocumentProcessor
 from src.legal_metadata import LegalMetadataExtractor, MetadataIndex
-from src.comprehensive_processor import ComprehensiveADREProcessor
+from src.comprehensive_processor import ComprehensiveADREProcessor, get_processor
+from src.hashing import sha256
 
 # Setup logging
 LOGGER = setup_logger(__name__)
@@ -50,12 +50,11 @@ def ingest_document_comprehensive(
         LOGGER.info(f"Processing {path.name}...")
         
         # Calculate file hash
-        with open(path, 'rb') as f:
-            digest = hashlib.sha256(f.read()).hexdigest()
+        digest = sha256(path)
         
         # Check if already processed
         collection = chroma_client.get_collection(collection_name)
-        existing = collection.get(where={"sha256": digest})
+        existing = collection.get(where={"sha256": digest}, include=[], limit=1)
         if existing['ids']:
             LOGGER.info(f"Skipping {path.name} (already processed)")
             return True
@@ -279,7 +278,7 @@ def ingest_directory_comprehensive(
     legal_processor = LegalDocumentProcessor()
     metadata_extractor = LegalMetadataExtractor()
     metadata_index = MetadataIndex(PROJECT_ROOT / "metadata" / f"{project_name}_metadata.json")
-    comprehensive_processor = ComprehensiveADREProcessor()
+    comprehensive_processor = get_processor()
     
     # Find all documents
     doc_files = []
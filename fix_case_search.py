@@ -44,19 +44,22 @@ class HybridCaseSearcher:
     def _search_by_filename(self, case_number: str) -> List[Dict[str, Any]]:
         """Search for documents by filename containing case number."""
         
-        # Get all documents from the collection
+        # Filter by filename using metadata only
         collection = self.db._collection
-        all_docs = collection.get(include=['documents', 'metadatas'])
+        all_meta = collection.get(include=['metadatas'])
+        matching_ids = [
+            doc_id for doc_id, metadata in zip(all_meta['ids'], all_meta['metadatas'])
+            if case_number in metadata.get('source', '')
+        ]
+        if not matching_ids:
+            return []
         
-        # Filter by filename
-        matching_docs = []
-        for i, metadata in enumerate(all_docs['metadatas']):
-            source = metadata.get('source', '')
-            if case_number in source:
-                matching_docs.append({
-                    'content': all_docs['documents'][i],
-                    'metadata': metadata
-                })
+        # Load text only for the matching chunks
+        hits = collection.get(ids=matching_ids, include=['documents', 'metadatas'])
+        matching_docs = [
+            {'content': content, 'metadata': metadata}
+            for content, metadata in zip(hits['documents'], hits['metadatas'])
+        ]
         
         # Sort by chunk priority if available
         def get_priority(doc):
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 import re
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
 from langchain_chroma import Chroma
@@ -13,32 +14,42 @@ from .config import INDEX_DIR, EMBED_MODEL
 from .legal_processor import LegalEntity
 from .legal_metadata import MetadataIndex
 
+# Upper bound on resolved citations kept in memory per resolver
+CITATION_CACHE_SIZE = 10_000
+
 
 class CitationResolver:
     """Resolves citations to actual documents in the index."""
     
-    def __init__(self, root_index: Path = INDEX_DIR):
+    def __init__(self, root_index: Path = INDEX_DIR, cache_size: int = CITATION_CACHE_SIZE):
         self.root_index = root_index
-        self.citation_cache: Dict[str, Optional[Document]] = {}
+        self.cache_size = cache_size
+        # LRU cache: most recently used citations live at the end
+        self.citation_cache: OrderedDict[str, Optional[Document]] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Per-project metadata, loaded once per resolver
+        self._metadata_indexes: Dict[str, MetadataIndex] = {}
+        self._document_citation_sets: Dict[str, Dict[str, Set[str]]] = {}
+        self._project_citation_sets: Dict[str, Set[str]] = {}
         
         # Citation normalization patterns
         self.normalization_rules = [
-            # Remove extra spaces
-            (r'\s+', ' '),
             # Normalize section symbols
             (r'§§?', '§'),
             # Normalize dashes
             (r'[-–—]', '-'),
-            # Remove trailing periods from citations
-            (r'\.$', ''),
         ]
     
     def normalize_citation(self, citation: str) -> str:
         """Normalize a citation for matching."""
-        normalized = citation.strip()
+        # Strip and collapse extra spaces
+        normalized = ' '.join(citation.split())
         for pattern, replacement in self.normalization_rules:
             normalized = re.sub(pattern, replacement, normalized)
-        return normalized
+        # Remove trailing periods from citations
+        return normalized.rstrip('.')
     
     def resolve_citation(self, citation: str, projects: List[str]) -> Optional[Document]:
         """Resolve a citation to a document in the index."""
@@ -46,26 +57,71 @@ class CitationResolver:
         
         # Check cache first
         if normalized in self.citation_cache:
+            self.citation_cache.move_to_end(normalized)
+            self.cache_hits += 1
             return self.citation_cache[normalized]
+        self.cache_misses += 1
         
         # Search in each project
         for project in projects:
             doc = self._search_project_for_citation(normalized, project)
             if doc:
-                self.citation_cache[normalized] = doc
+                self._cache_citation(normalized, doc)
                 return doc
         
-        self.citation_cache[normalized] = None
+        self._cache_citation(normalized, None)
         return None
     
+    def _cache_citation(self, normalized: str, doc: Optional[Document]):
+        """Store a resolution result, evicting the least recently used entry."""
+        self.citation_cache[normalized] = doc
+        self.citation_cache.move_to_end(normalized)
+        if len(self.citation_cache) > self.cache_size:
+            self.citation_cache.popitem(last=False)
+    
+    def _get_metadata_index(self, project: str) -> Optional[MetadataIndex]:
+        """Load a project's metadata index, caching it for later calls."""
+        if project not in self._metadata_indexes:
+            proj_dir = self.root_index / project
+            if not proj_dir.exists():
+                return None
+            self._metadata_indexes[project] = MetadataIndex(proj_dir)
+        return self._metadata_indexes[project]
+    
+    def _document_citations(self, project: str) -> Dict[str, Set[str]]:
+        """Map each document sha256 in a project to its normalized citations."""
+        doc_citations = self._document_citation_sets.get(project)
+        if doc_citations is None:
+            doc_citations = {}
+            metadata_index = self._get_metadata_index(project)
+            if metadata_index is not None:
+                for sha256, metadata in metadata_index.index.items():
+                    doc_citations[sha256] = {
+                        self.normalize_citation(c) for c in metadata.all_citations()
+                    }
+            self._document_citation_sets[project] = doc_citations
+        return doc_citations
+    
+    def _project_citations(self, project: str) -> Set[str]:
+        """Return every normalized citation cited in a project.
+        
+        Used as an exact negative-lookup filter so projects that never cite
+        a citation are skipped before any vector store is opened.
+        """
+        citations = self._project_citation_sets.get(project)
+        if citations is None:
+            citations = set().union(*self._document_citations(project).values())
+            self._project_citation_sets[project] = citations
+        return citations
+    
     def _search_project_for_citation(self, citation: str, project: str) -> Optional[Document]:
         """Search a specific project for a citation."""
         proj_dir = self.root_index / project
-        if not proj_dir.exists():
-            return None
         
         # Load metadata index
-        metadata_index = MetadataIndex(proj_dir)
+        metadata_index = self._get_metadata_index(project)
+        if metadata_index is None:
+            return None
         
         # Search by citation in metadata
         results = metadata_index.search(
@@ -116,9 +172,9 @@ class CitationResolver:
     
     def resolve_all_citations(self, text: str, projects: List[str]) -> Dict[str, Optional[Document]]:
         """Resolve all citations found in a text."""
-        from .legal_processor import LegalDocumentProcessor
+        from .legal_processor import get_legal_processor
         
-        processor = LegalDocumentProcessor()
+        processor = get_legal_processor()
         citations = processor.extract_citations(text)
         
         resolved = {}
@@ -136,23 +192,15 @@ class CitationResolver:
         citation_graph = {}
         
         for project in projects:
-            proj_dir = self.root_index / project
-            if not proj_dir.exists():
+            metadata_index = self._get_metadata_index(project)
+            if metadata_index is None:
                 continue
             
-            metadata_index = MetadataIndex(proj_dir)
-            
-            for sha256, metadata in metadata_index.index.items():
-                doc_key = f"{project}:{metadata.file_name}"
-                citations = []
-                
-                # Collect all citations
-                citations.extend(metadata.statutes_cited)
-                citations.extend(metadata.cases_cited)
-                citations.extend(metadata.regulations_cited)
-                
+            for metadata in metadata_index.index.values():
+                # Collect all citations in a single allocation
+                citations = metadata.all_citations()
                 if citations:
-                    citation_graph[doc_key] = citations
+                    citation_graph[f"{project}:{metadata.file_name}"] = citations
         
         return citation_graph
     
@@ -161,39 +209,44 @@ class CitationResolver:
         citing_docs = []
         normalized = self.normalize_citation(citation)
         
+        # First pass: decide which documents match (no vector store I/O)
+        project_matches: Dict[str, List[str]] = {}
         for project in projects:
-            proj_dir = self.root_index / project
-            if not proj_dir.exists():
+            # Skip projects that never cite this citation
+            if normalized not in self._project_citations(project):
                 continue
             
-            metadata_index = MetadataIndex(proj_dir)
+            shas = [
+                sha256
+                for sha256, doc_citations in self._document_citations(project).items()
+                if normalized in doc_citations
+            ]
+            if shas:
+                project_matches[project] = shas
+        
+        # Second pass: load the matching documents with one query per project
+        for project, shas in project_matches.items():
+            db = Chroma(
+                persist_directory=str(self.root_index / project),
+                collection_name=project,
+                embedding_function=OpenAIEmbeddings(model=EMBED_MODEL),
+            )
             
-            # Search for documents containing this citation
-            for sha256, metadata in metadata_index.index.items():
-                all_citations = (
-                    metadata.statutes_cited + 
-                    metadata.cases_cited + 
-                    metadata.regulations_cited
-                )
-                
-                # Check if any citation matches
-                for doc_citation in all_citations:
-                    if self.normalize_citation(doc_citation) == normalized:
-                        # Load the document
-                        db = Chroma(
-                            persist_directory=str(proj_dir),
-                            collection_name=project,
-                            embedding_function=OpenAIEmbeddings(model=EMBED_MODEL),
-                        )
-                        
-                        docs = db.get(where={"sha256": sha256})
-                        if docs and docs["documents"]:
-                            doc = Document(
-                                page_content=docs["documents"][0],
-                                metadata=docs["metadatas"][0]
-                            )
-                            citing_docs.append((project, doc))
-                            break
+            docs = db.get(
+                where={"sha256": {"$in": shas}},
+                include=["documents", "metadatas"],
+            )
+            
+            # Keep the first chunk stored for each document
+            first_chunks: Dict[str, Document] = {}
+            for content, metadata in zip(docs["documents"], docs["metadatas"]):
+                sha256 = metadata.get("sha256")
+                if sha256 not in first_chunks:
+                    first_chunks[sha256] = Document(page_content=content, metadata=metadata)
+            
+            citing_docs.extend(
+                (project, first_chunks[sha256]) for sha256 in shas if sha256 in first_chunks
+            )
         
         return citing_docs
 
@@ -208,8 +261,8 @@ class CitationEnhancer:
                         include_full_text: bool = False) -> str:
         """Enhance a response by resolving and adding citation information."""
         # Extract citations from response
-        from .legal_processor import LegalDocumentProcessor
-        processor = LegalDocumentProcessor()
+        from .legal_processor import get_legal_processor
+        processor = get_legal_processor()
         citations = processor.extract_citations(response)
         
         # Resolve each citation
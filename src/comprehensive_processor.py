@@ -7,11 +7,193 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import logging
 
+from dateutil import parser as date_parser
+
+from .regex_compat import compile_pattern
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Non-ASCII characters whose upper() contains ASCII letters: sharp s,
+# dotless i, long s, the ligatures and a few letters with no precomposed
+# capital (all of them as of Unicode 14).
+_UPPER_TO_ASCII = '\u00df\u0131\u0149\u017f\u01f0\u1e96\u1e97\u1e98\u1e99\u1e9a\ufb00\ufb01\ufb02\ufb03\ufb04\ufb05\ufb06'
+
+# Patterns shared by every processor, compiled once at import
+_FILENAME_CASE_RE = compile_pattern(r'(\d{2}[A-Z]\-[A-Z]\d+(?:\-REL)?(?:\-RHG)?)')
+_PRO_SE_RE = compile_pattern(r'(?:appearing\s+)?pro\s+se|self[\-\s]represented', re.IGNORECASE)
+# Terms that disqualify a candidate name. Matched as substrings, not whole
+# words, so e.g. "Casey" is rejected as a party name just as before.
+_INVALID_PARTY_TERMS_RE = compile_pattern(
+    r'respondent|petitioner|complainant|matter|case|docket', re.IGNORECASE
+)
+_INVALID_ATTORNEY_TERMS_RE = compile_pattern(
+    r'copy|order|decision|arizona|department|transmitted', re.IGNORECASE
+)
+_INVALID_JUDGE_TERMS_RE = compile_pattern(
+    r'copy|order|decision|arizona|department|transmitted|page', re.IGNORECASE
+)
+
+# Sentence tail shared by the outcome patterns: text up to a closing period
+# with no empty sentences, capped so a missing period cannot make a match
+# run across the rest of the document.
+_LINE_TAIL = r'[^.\n](?:[^.\n]|\.(?=[^.\n])){0,1998}\.'
+_BLOCK_TAIL = r'[^.](?:[^.]|\.(?=[^.])){0,2998}\.'
+# Findings and conclusions are scanned in one pass. The alternation sits in
+# a lookahead so a conclusion nested inside a finding's text (or vice
+# versa) is still seen; _extract_outcomes drops same-kind overlaps. The
+# leading character class lets the engine skip ahead to candidate starts.
+_OUTCOMES_RE = compile_pattern(
+    r'(?=[FCL])(?=(?:FINDING|FACT)\s*(?:OF\s+FACT\s*)?#?\s*(?P<finding_num>\d+)[:\.]?\s*'
+    rf'(?P<finding>{_LINE_TAIL})'
+    r'|(?:CONCLUSION|LAW)\s*(?:OF\s+LAW\s*)?#?\s*(?P<conclusion_num>\d+)[:\.]?\s*'
+    rf'(?P<conclusion>{_LINE_TAIL}))',
+    re.IGNORECASE
+)
+# Numbered findings and conclusions follow the "Findings of Fact" heading;
+# the outcome scan starts there when the heading is present.
+_FINDINGS_ANCHOR_RE = compile_pattern(r'FINDINGS?\s+OF\s+FACT', re.IGNORECASE)
+_ORDER_PATTERNS = [
+    compile_pattern(p, re.IGNORECASE | re.MULTILINE) for p in (
+        rf'IT\s+IS\s+(?:HEREBY\s+)?ORDERED\s+(?:THAT\s+)?({_BLOCK_TAIL})',
+        rf'ORDERS?\s*:\s*\n({_BLOCK_TAIL})',
+        rf'(?:HEREBY\s+)?ORDERS?\s+(?:AS\s+FOLLOWS\s*:?\s*)?({_BLOCK_TAIL})',
+    )
+]
+_DATE_PATTERNS = [
+    (compile_pattern(p, re.IGNORECASE), date_type) for p, date_type in (
+        (r'(?:hearing|heard)\s+on\s+(\w+\s+\d{1,2},?\s+\d{4})', 'hearing'),
+        (r'(?:dated?|issued?)\s+(?:this\s+)?(\w+\s+\d{1,2},?\s+\d{4})', 'decision'),
+        (r'(?:filed?\s+on\s+|filing\s+date:?\s*)(\w+\s+\d{1,2},?\s+\d{4})', 'filing'),
+        (r'(\d{1,2}/\d{1,2}/\d{4})', 'general'),
+    )
+]
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate((
+        ('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'),
+        ('may',), ('jun', 'june'), ('jul', 'july'), ('aug', 'august'),
+        ('sep', 'sept', 'september'), ('oct', 'october'), ('nov', 'november'),
+        ('dec', 'december'),
+    ), start=1)
+    for name in names
+}
+
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse a date matched by ``_DATE_PATTERNS``.
+
+    The fixed "M/D/YYYY" and "Month D, YYYY" shapes are built directly;
+    anything else (day-first numeric dates, two-digit-century years)
+    falls back to dateutil.
+    Raises ValueError or OverflowError when the string is not a date.
+    """
+    if '/' in date_str:
+        month, day, year = date_str.split('/')
+        if int(month) <= 12 and int(year) >= 100:
+            return datetime(int(year), int(month), int(day))
+    else:
+        month_name, day, year = date_str.replace(',', ' ').split()
+        month = _MONTHS.get(month_name.lower())
+        if month is not None and int(year) >= 100:
+            return datetime(int(year), month, int(day))
+    
+    return date_parser.parse(date_str)
+
+
+# Bounded building blocks for name captures. Unbounded nested quantifiers
+# over overlapping classes backtrack polynomially on long capitalised runs.
+_ATTORNEY_NAME = r'[A-Z][a-z]{1,30}(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]{1,30}(?:\s+[A-Z][a-z]{1,30}){0,3}'
+_JUDGE_NAME = r'[A-Z][a-z]{1,30}(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]{1,30}){1,4}'
+_PARTY_NAME = r"[A-Z][a-zA-Z\s,\.\']{1,80}?"
+_ORG_NAME = r'[A-Z][a-zA-Z\s]{1,80}?'
+# Anchors for names with nothing before them: start at the first letter of
+# a run of name characters, as the unbounded patterns did. Without it a run
+# longer than the bound matches from somewhere in its middle.
+_PARTY_START = r"(?<![a-zA-Z\s,\.\'])[\s,\.\']*"
+_ORG_START = r'(?<![a-zA-Z\s])\s*'
+
+
+def _collapse_whitespace(text: str) -> str:
+    """Collapse whitespace runs to single spaces, like ``re.sub(r'\\s+', ' ', text)``."""
+    collapsed = ' '.join(text.split())
+    # str.split() drops leading/trailing runs that re.sub would keep as a space
+    if text[:1].isspace():
+        collapsed = ' ' + collapsed
+    if text[-1:].isspace() and collapsed != ' ':
+        collapsed += ' '
+    return collapsed
+
+
+def _compile_patterns(patterns: Dict[str, List[str]],
+                      flags: int = re.IGNORECASE) -> Dict[str, List[re.Pattern]]:
+    """Compile a dict of pattern lists, baking the match flags into each pattern."""
+    return {key: [compile_pattern(p, flags) for p in group] for key, group in patterns.items()}
+
+
+
+def _compile_ranked(patterns: List[str], first_chars: str,
+                    flags: int = re.IGNORECASE) -> re.Pattern:
+    """Combine single-group patterns, listed by priority, into one pattern.
+    
+    The alternation sits in a lookahead so every start position is tried
+    and a lower-priority match cannot hide a higher-priority one.
+    ``first_chars`` is a character class of every possible first character;
+    it lets the engine skip positions cheaply. Use with ``_search_ranked``.
+    """
+    alternatives = '|'.join(f'(?:{p})' for p in patterns)
+    return compile_pattern(f'(?=[{first_chars}])(?={alternatives})', flags)
+
+
+def _search_ranked(pattern: re.Pattern, text: str) -> Optional[str]:
+    """Return the capture of the first listed pattern that matches anywhere.
+    
+    Equivalent to searching each pattern in turn and taking the first hit,
+    but done in a single scan.
+    """
+    best = None
+    for match in pattern.finditer(text):
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+            if best.lastindex == 1:
+                break
+    return best.group(best.lastindex) if best else None
+
+
+
+def clean_name(name: str) -> str:
+    """Clean and normalize name."""
+    return ' '.join(name.split()).rstrip('.,;:').title()
+
+
+def is_valid_party_name(name: str) -> bool:
+    """Validate party name."""
+    if not name or len(name) < 3:
+        return False
+    
+    return not _INVALID_PARTY_TERMS_RE.search(name)
+
+
+def is_valid_attorney_name(name: str) -> bool:
+    """Validate attorney name."""
+    if not name or len(name) < 5 or len(name.split()) < 2:
+        return False
+    
+    return not _INVALID_ATTORNEY_TERMS_RE.search(name)
+
+
+def is_valid_judge_name(name: str) -> bool:
+    """Validate judge name."""
+    if not name or len(name) < 5 or len(name.split()) < 2:
+        return False
+    
+    return not _INVALID_JUDGE_TERMS_RE.search(name)
+
+
+@dataclass(slots=True)
 class ComprehensiveADRECase:
     """Complete metadata for ADRE/OAH cases."""
     # Case identification
@@ -87,154 +269,168 @@ class ComprehensiveADRECase:
 class ComprehensiveADREProcessor:
     """Enhanced processor for complete ADRE/OAH metadata extraction."""
     
-    def __init__(self):
-        # Case identification patterns
-        self.case_patterns = {
-            'oah_docket': [
-                r'OAH\s+(?:Docket\s+)?(?:No\.?\s*)?([A-Z0-9\-]+)',
-                r'Docket\s+(?:No\.?\s*)?([A-Z0-9\-]+)',
-                r'(?:ALJ|Administrative\s+Law\s+Judge)\s+(?:Docket\s+)?(?:No\.?\s*)?([A-Z0-9\-]+)'
-            ],
-            'adre_case': [
-                r'ADRE\s+(?:Case\s+)?(?:No\.?\s*)?([A-Z0-9\-]+)',
-                r'Case\s+(?:No\.?\s*)?(\d{2}[A-Z]\-[A-Z]\d+(?:\-REL)?(?:\-RHG)?)',
-                r'(?:In\s+)?(?:the\s+)?(?:Matter\s+of\s+)?(?:Case\s+)?(\d{2}[A-Z]\-[A-Z]\d+(?:\-REL)?(?:\-RHG)?)'
-            ]
-        }
-        
-        # Party identification patterns
-        self.party_patterns = {
-            'petitioner': [
-                r'(?:Petitioner|Complainant):\s*([A-Z][a-zA-Z\s,\.\']+?)(?:\n|,\s*(?:Respondent|and))',
-                r'(?:In\s+the\s+)?(?:Matter\s+of\s+)?([A-Z][a-zA-Z\s,\.\']+?),?\s*(?:Petitioner|Complainant)',
-                r'([A-Z][a-zA-Z\s,\.\']+?)\s*(?:v\.?\s*|vs\.?\s*|against)'
-            ],
-            'respondent': [
-                r'(?:Respondent|Defendant):\s*([A-Z][a-zA-Z\s,\.\']+?)(?:\n|$)',
-                r'([A-Z][a-zA-Z\s,\.\']+?),?\s*(?:Respondent|Defendant)',
-                r'(?:v\.?\s*|vs\.?\s*)([A-Z][a-zA-Z\s,\.\']+?)(?:\n|$)'
-            ],
-            'hoa': [
-                r'([A-Z][a-zA-Z\s]+?)\s+(?:Homeowners?\s+Association|HOA)(?:\s*,?\s*Inc\.?)?',
-                r'([A-Z][a-zA-Z\s]+?)\s+(?:Community\s+Association|Condominium\s+Association)',
-                r'([A-Z][a-zA-Z\s]+?)\s+(?:Property\s+Owners?\s+Association|POA)'
-            ],
-            'management': [
-                r'([A-Z][a-zA-Z\s]+?)\s+(?:Property\s+)?Management(?:\s+(?:Company|Corp?|LLC|Inc))?',
-                r'([A-Z][a-zA-Z\s]+?)\s+(?:Management\s+Services|Mgmt)',
-                r'([A-Z][a-zA-Z\s]+?)\s+(?:Community\s+)?Management'
-            ]
-        }
-        
-        # Legal representation patterns
-        self.attorney_patterns = {
-            'petitioner_attorney': [
-                r'(?:For\s+(?:the\s+)?Petitioner|Petitioner\s+represented\s+by):\s*([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-                r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s+(?:Esq\.?,?\s+)?(?:for|representing)\s+(?:the\s+)?Petitioner'
-            ],
-            'respondent_attorney': [
-                r'(?:For\s+(?:the\s+)?Respondent|Respondent\s+represented\s+by):\s*([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-                r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s+(?:Esq\.?,?\s+)?(?:for|representing)\s+(?:the\s+)?Respondent'
-            ],
-            'esq_titles': [
-                r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s+Esq\.?'
-            ],
-            'aag': [
-                r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s+Assistant\s+Attorney\s+General',
-                r'Assistant\s+Attorney\s+General\s*[:.]?\s*([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
-            ]
-        }
-        
-        # Judge patterns
-        self.judge_patterns = {
-            'alj': [
-                r'ADMINISTRATIVE\s+LAW\s+JUDGE:\s*([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)',
-                r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)\s*,?\s*Administrative\s+Law\s+Judge',
-                r'Before\s+(?:the\s+Honorable\s+)?([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+),?\s+Administrative\s+Law\s+Judge'
-            ],
-            'judge': [
-                r'(?:Judge|Hearing\s+Officer):\s*([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)',
-                r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+),?\s+(?:Judge|Hearing\s+Officer)'
-            ]
-        }
-        
-        # Legal violation patterns
-        self.violation_patterns = {
-            'ars': [
-                r'A\.R\.S\.?\s*§?\s*([0-9\-]+(?:\.[0-9A-Z\-]+)*)',
-                r'Arizona\s+Revised\s+Statutes?\s*§?\s*([0-9\-]+(?:\.[0-9A-Z\-]+)*)',
-                r'(?:Pursuant\s+to\s+|Under\s+|Violat(?:ing|ed?|ion)\s+(?:of\s+)?)?A\.R\.S\.?\s*§?\s*([0-9\-]+(?:\.[0-9A-Z\-]+)*)'
-            ],
-            'aac': [
-                r'A\.A\.C\.?\s*R?([0-9\-]+(?:\.[0-9A-Z\-]+)*)',
-                r'Arizona\s+Administrative\s+Code\s*R?([0-9\-]+(?:\.[0-9A-Z\-]+)*)',
-                r'(?:Pursuant\s+to\s+|Under\s+|Violat(?:ing|ed?|ion)\s+(?:of\s+)?)?A\.A\.C\.?\s*R?([0-9\-]+(?:\.[0-9A-Z\-]+)*)'
-            ]
-        }
-        
-        # HOA document violation patterns
-        self.hoa_violation_patterns = {
-            'ccr': [
-                r'CC&R[s]?\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
-                r'(?:Covenants?,?\s*)?Conditions?,?\s*(?:and\s+)?Restrictions?\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
-                r'Covenant[s]?\s*(?:Section\s*|§\s*)?([0-9\.]+)?'
-            ],
-            'bylaws': [
-                r'(?:Bylaws?|By-laws?)\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
-                r'(?:Corporate\s+)?Bylaws?\s*(?:Section\s*|§\s*)?([0-9\.]+)?'
-            ],
-            'declaration': [
-                r'Declaration\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
-                r'Declaration\s+of\s+(?:Covenants?|Restrictions?)\s*(?:Section\s*|§\s*)?([0-9\.]+)?'
-            ],
-            'architectural': [
-                r'Architectural\s+(?:Guidelines?|Standards?|Requirements?|Rules?)\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
-                r'Design\s+(?:Guidelines?|Standards?|Requirements?)\s*(?:Section\s*|§\s*)?([0-9\.]+)?'
-            ],
-            'governing_doc': [
-                r'Governing\s+Documents?\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
-                r'Community\s+Documents?\s*(?:Section\s*|§\s*)?([0-9\.]+)?'
-            ]
-        }
-        
-        # Penalty patterns
-        self.penalty_patterns = {
-            'monetary_fine': [
-                r'(?:fine|penalty|assessment)\s+(?:of\s+)?\$([0-9,]+(?:\.[0-9]{2})?)',
-                r'\$([0-9,]+(?:\.[0-9]{2})?)\s+(?:fine|penalty|assessment)',
-                r'(?:civil\s+)?(?:money\s+)?penalty\s+(?:of\s+)?\$([0-9,]+(?:\.[0-9]{2})?)'
-            ],
-            'compliance_order': [
-                r'(?:order(?:ed)?|direct(?:ed)?|require[ds]?)\s+(?:to\s+)?(?:comply|bring\s+into\s+compliance)',
-                r'compliance\s+(?:order|directive)',
-                r'(?:must|shall)\s+(?:comply|bring\s+into\s+compliance)'
-            ],
-            'cease_desist': [
-                r'cease\s+and\s+desist',
-                r'stop\s+(?:and\s+)?(?:cease|desist)',
-                r'discontinue\s+(?:the\s+)?(?:practice|activity|conduct)'
-            ]
-        }
-        
-        # Document type indicators
-        self.doc_type_indicators = {
-            'final_order': ['FINAL ORDER', 'ORDER AND DECISION', 'DECISION AND ORDER'],
-            'findings_of_fact': ['FINDINGS OF FACT', 'FINDINGS AND CONCLUSIONS'],
-            'notice_of_hearing': ['NOTICE OF HEARING', 'HEARING NOTICE'],
-            'motion': ['MOTION FOR', 'MOTION TO'],
-            'complaint': ['COMPLAINT', 'PETITION'],
-            'settlement': ['CONSENT ORDER', 'SETTLEMENT AGREEMENT'],
-            'dismissal': ['ORDER OF DISMISSAL', 'DISMISSAL'],
-            'summary_judgment': ['SUMMARY JUDGMENT', 'MOTION FOR SUMMARY JUDGMENT']
-        }
+    # Pattern tables are class attributes so they are compiled once per
+    # process and shared by every instance.
+    
+    # Case identification patterns
+    case_patterns = {
+        'oah_docket': _compile_ranked([
+            r'OAH\s+(?:Docket\s+)?(?:No\.?\s*)?([A-Z0-9\-]+)',
+            r'Docket\s+(?:No\.?\s*)?([A-Z0-9\-]+)',
+            r'(?:ALJ|Administrative\s+Law\s+Judge)\s+(?:Docket\s+)?(?:No\.?\s*)?([A-Z0-9\-]+)'
+        ], first_chars='ODA'),
+        'adre_case': _compile_ranked([
+            r'ADRE\s+(?:Case\s+)?(?:No\.?\s*)?([A-Z0-9\-]+)',
+            r'Case\s+(?:No\.?\s*)?(\d{2}[A-Z]\-[A-Z]\d+(?:\-REL)?(?:\-RHG)?)',
+            r'(?:In\s+)?(?:the\s+)?(?:Matter\s+of\s+)?(?:Case\s+)?(\d{2}[A-Z]\-[A-Z]\d+(?:\-REL)?(?:\-RHG)?)'
+        ], first_chars=r'ACITM\d')
+    }
+    
+    # Party identification patterns
+    party_patterns = _compile_patterns({
+        'petitioner': [
+            rf'(?:Petitioner|Complainant):\s*({_PARTY_NAME})(?:\n|,\s*(?:Respondent|and))',
+            rf'{_PARTY_START}(?:In\s+the\s+)?(?:Matter\s+of\s+)?({_PARTY_NAME}),?\s*(?:Petitioner|Complainant)',
+            rf'{_PARTY_START}({_PARTY_NAME})\s*(?:v\.?\s*|vs\.?\s*|against)'
+        ],
+        'respondent': [
+            rf'(?:Respondent|Defendant):\s*({_PARTY_NAME})(?:\n|$)',
+            rf'{_PARTY_START}({_PARTY_NAME}),?\s*(?:Respondent|Defendant)',
+            rf'(?:v\.?\s*|vs\.?\s*)({_PARTY_NAME})(?:\n|$)'
+        ],
+        'hoa': [
+            rf'{_ORG_START}({_ORG_NAME})\s+(?:Homeowners?\s+Association|HOA)(?:\s*,?\s*Inc\.?)?',
+            rf'{_ORG_START}({_ORG_NAME})\s+(?:Community\s+Association|Condominium\s+Association)',
+            rf'{_ORG_START}({_ORG_NAME})\s+(?:Property\s+Owners?\s+Association|POA)'
+        ],
+        'management': [
+            rf'{_ORG_START}({_ORG_NAME})\s+(?:Property\s+)?Management(?:\s+(?:Company|Corp?|LLC|Inc))?',
+            rf'{_ORG_START}({_ORG_NAME})\s+(?:Management\s+Services|Mgmt)',
+            rf'{_ORG_START}({_ORG_NAME})\s+(?:Community\s+)?Management'
+        ]
+    })
+    
+    # Legal representation patterns
+    attorney_patterns = _compile_patterns({
+        'petitioner_attorney': [
+            rf'(?:For\s+(?:the\s+)?Petitioner|Petitioner\s+represented\s+by):\s*({_ATTORNEY_NAME})',
+            rf'({_ATTORNEY_NAME}),?\s+(?:Esq\.?,?\s+)?(?:for|representing)\s+(?:the\s+)?Petitioner'
+        ],
+        'respondent_attorney': [
+            rf'(?:For\s+(?:the\s+)?Respondent|Respondent\s+represented\s+by):\s*({_ATTORNEY_NAME})',
+            rf'({_ATTORNEY_NAME}),?\s+(?:Esq\.?,?\s+)?(?:for|representing)\s+(?:the\s+)?Respondent'
+        ],
+        'esq_titles': [
+            rf'({_ATTORNEY_NAME}),?\s+Esq\.?'
+        ],
+        'aag': [
+            rf'({_ATTORNEY_NAME}),?\s+Assistant\s+Attorney\s+General',
+            rf'Assistant\s+Attorney\s+General\s*[:.]?\s*({_ATTORNEY_NAME})'
+        ]
+    })
+    
+    # Judge patterns
+    judge_patterns = _compile_patterns({
+        'alj': [
+            rf'ADMINISTRATIVE\s+LAW\s+JUDGE:\s*({_JUDGE_NAME})',
+            rf'({_JUDGE_NAME})\s*,?\s*Administrative\s+Law\s+Judge',
+            rf'Before\s+(?:the\s+Honorable\s+)?({_JUDGE_NAME}),?\s+Administrative\s+Law\s+Judge'
+        ],
+        'judge': [
+            rf'(?:Judge|Hearing\s+Officer):\s*({_JUDGE_NAME})',
+            rf'({_JUDGE_NAME}),?\s+(?:Judge|Hearing\s+Officer)'
+        ]
+    }, re.IGNORECASE | re.MULTILINE)
+    
+    # Legal violation patterns, one alternation per citation family
+    violation_patterns = {
+        'ars': compile_pattern(
+            r'(?:A\.R\.S\.?|Arizona\s+Revised\s+Statutes?)\s*§?\s*([0-9\-]+(?:\.[0-9A-Z\-]+)*)',
+            re.IGNORECASE
+        ),
+        'aac': compile_pattern(
+            r'(?:A\.A\.C\.?|Arizona\s+Administrative\s+Code)\s*R?([0-9\-]+(?:\.[0-9A-Z\-]+)*)',
+            re.IGNORECASE
+        ),
+    }
+    
+    # HOA document violation patterns
+    hoa_violation_patterns = _compile_patterns({
+        'ccr': [
+            r'CC&R[s]?\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
+            r'(?:Covenants?,?\s*)?Conditions?,?\s*(?:and\s+)?Restrictions?\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
+            r'Covenant[s]?\s*(?:Section\s*|§\s*)?([0-9\.]+)?'
+        ],
+        'bylaws': [
+            r'(?:Bylaws?|By-laws?)\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
+            r'(?:Corporate\s+)?Bylaws?\s*(?:Section\s*|§\s*)?([0-9\.]+)?'
+        ],
+        'declaration': [
+            r'Declaration\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
+            r'Declaration\s+of\s+(?:Covenants?|Restrictions?)\s*(?:Section\s*|§\s*)?([0-9\.]+)?'
+        ],
+        'architectural': [
+            r'Architectural\s+(?:Guidelines?|Standards?|Requirements?|Rules?)\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
+            r'Design\s+(?:Guidelines?|Standards?|Requirements?)\s*(?:Section\s*|§\s*)?([0-9\.]+)?'
+        ],
+        'governing_doc': [
+            r'Governing\s+Documents?\s*(?:Section\s*|§\s*)?([0-9\.]+)?',
+            r'Community\s+Documents?\s*(?:Section\s*|§\s*)?([0-9\.]+)?'
+        ]
+    })
+    
+    # Penalty patterns
+    penalty_patterns = _compile_patterns({
+        'monetary_fine': [
+            r'(?:fine|penalty|assessment)\s+(?:of\s+)?\$([0-9,]+(?:\.[0-9]{2})?)',
+            r'\$([0-9,]+(?:\.[0-9]{2})?)\s+(?:fine|penalty|assessment)',
+            r'(?:civil\s+)?(?:money\s+)?penalty\s+(?:of\s+)?\$([0-9,]+(?:\.[0-9]{2})?)'
+        ],
+        'compliance_order': [
+            r'(?:order(?:ed)?|direct(?:ed)?|require[ds]?)\s+(?:to\s+)?(?:comply|bring\s+into\s+compliance)',
+            r'compliance\s+(?:order|directive)',
+            r'(?:must|shall)\s+(?:comply|bring\s+into\s+compliance)'
+        ],
+        'cease_desist': [
+            r'cease\s+and\s+desist',
+            r'stop\s+(?:and\s+)?(?:cease|desist)',
+            r'discontinue\s+(?:the\s+)?(?:practice|activity|conduct)'
+        ]
+    })
+    
+    # Document type indicators
+    doc_type_indicators = {
+        'final_order': ['FINAL ORDER', 'ORDER AND DECISION', 'DECISION AND ORDER'],
+        'findings_of_fact': ['FINDINGS OF FACT', 'FINDINGS AND CONCLUSIONS'],
+        'notice_of_hearing': ['NOTICE OF HEARING', 'HEARING NOTICE'],
+        'motion': ['MOTION FOR', 'MOTION TO'],
+        'complaint': ['COMPLAINT', 'PETITION'],
+        'settlement': ['CONSENT ORDER', 'SETTLEMENT AGREEMENT'],
+        'dismissal': ['ORDER OF DISMISSAL', 'DISMISSAL'],
+        'summary_judgment': ['SUMMARY JUDGMENT', 'MOTION FOR SUMMARY JUDGMENT']
+    }
+    
+    # Later doc types take precedence, so they are checked first. Indicators
+    # are matched against the uppercased document: upper() expands
+    # ligatures from PDF text ("\ufb01nal order" -> "FINAL ORDER"), which
+    # neither IGNORECASE matching nor an ASCII encoding does.
+    _doc_type_needles = list(reversed(doc_type_indicators.items()))
+    # Unless the document contains a character in _UPPER_TO_ASCII, upper()
+    # only changes ASCII letters as far as these ASCII indicators can see,
+    # so they are matched as lowercase bytes against an ASCII encoding of
+    # the document instead, which is cheaper to build than an uppercased
+    # copy and gives the same result.
+    _doc_type_byte_needles = [
+        (doc_type, [indicator.lower().encode('ascii') for indicator in indicators])
+        for doc_type, indicators in _doc_type_needles
+    ]
     
     def extract_comprehensive_metadata(self, text: str, filename: str) -> ComprehensiveADRECase:
         """Extract all comprehensive metadata from ADRE/OAH document."""
         case = ComprehensiveADRECase(case_number=self._extract_case_number_from_filename(filename))
         
         # Clean text for processing
-        text_clean = re.sub(r'\s+', ' ', text)
-        text_lines = text.split('\n')
+        text_clean = _collapse_whitespace(text)
         
         # Extract case identification
         self._extract_case_info(case, text_clean)
@@ -243,10 +439,10 @@ class ComprehensiveADREProcessor:
         self._extract_parties(case, text_clean)
         
         # Extract legal representation
-        self._extract_attorneys(case, text, text_clean)
+        self._extract_attorneys(case, text)
         
         # Extract judicial information
-        self._extract_judges(case, text, text_lines)
+        self._extract_judges(case, text)
         
         # Extract legal violations
         self._extract_legal_violations(case, text_clean)
@@ -268,27 +464,38 @@ class ComprehensiveADREProcessor:
         
         return case
     
+    def extract_batch(self, docs: List[Tuple[str, str]],
+                      max_workers: Optional[int] = None) -> List[ComprehensiveADRECase]:
+        """Extract metadata for many ``(text, filename)`` pairs across processes.
+        
+        Results are returned in input order. ``max_workers`` defaults to the
+        CPU count.
+        """
+        if not docs:
+            return []
+        
+        texts, filenames = zip(*docs)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.extract_comprehensive_metadata,
+                                     texts, filenames, chunksize=8))
+    
     def _extract_case_info(self, case: ComprehensiveADRECase, text: str):
         """Extract case identification information."""
-        for pattern in self.case_patterns['oah_docket']:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                case.oah_docket = match.group(1)
-                break
-        
-        for pattern in self.case_patterns['adre_case']:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                case.adre_case_no = match.group(1)
-                if not case.case_number or case.case_number == case.adre_case_no:
-                    case.case_number = match.group(1)
-                break
+        docket = _search_ranked(self.case_patterns['oah_docket'], text)
+        if docket:
+            case.oah_docket = docket
+        
+        adre_case_no = _search_ranked(self.case_patterns['adre_case'], text)
+        if adre_case_no:
+            case.adre_case_no = adre_case_no
+            if not case.case_number or case.case_number == adre_case_no:
+                case.case_number = adre_case_no
     
     def _extract_parties(self, case: ComprehensiveADRECase, text: str):
         """Extract party information."""
         # Extract petitioner
         for pattern in self.party_patterns['petitioner']:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 name = self._clean_name(match.group(1))
                 if self._is_valid_party_name(name):
@@ -297,17 +504,16 @@ class ComprehensiveADREProcessor:
         
         # Extract respondent
         for pattern in self.party_patterns['respondent']:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 name = self._clean_name(match.group(1))
                 if self._is_valid_party_name(name):
                     case.respondent_name = name
                     break
         
-        # Extract HOA name
+        # Extract HOA name (first pattern with a usable name wins)
         for pattern in self.party_patterns['hoa']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in pattern.finditer(text):
                 hoa_name = self._clean_name(match.group(1))
                 if len(hoa_name) > 3:
                     case.hoa_name = hoa_name
@@ -315,23 +521,25 @@ class ComprehensiveADREProcessor:
                     if not case.respondent_name:
                         case.respondent_name = f"{hoa_name} Homeowners Association"
                     break
+            if case.hoa_name:
+                break
         
         # Extract management company
         for pattern in self.party_patterns['management']:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 mgmt_name = self._clean_name(match.group(1))
                 if len(mgmt_name) > 3:
                     case.management_company = mgmt_name
-                    if "management" in case.respondent_name.lower() if case.respondent_name else False:
+                    if case.respondent_name and "management" in case.respondent_name.lower():
                         case.respondent_type = "management_company"
                     break
     
-    def _extract_attorneys(self, case: ComprehensiveADRECase, text: str, text_clean: str):
+    def _extract_attorneys(self, case: ComprehensiveADRECase, text: str):
         """Extract attorney information."""
         # Extract petitioner attorneys
         for pattern in self.attorney_patterns['petitioner_attorney']:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 name = self._clean_name(match.group(1))
                 if self._is_valid_attorney_name(name):
@@ -340,7 +548,7 @@ class ComprehensiveADREProcessor:
         
         # Extract respondent attorneys
         for pattern in self.attorney_patterns['respondent_attorney']:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 name = self._clean_name(match.group(1))
                 if self._is_valid_attorney_name(name):
@@ -350,7 +558,7 @@ class ComprehensiveADREProcessor:
         # Extract all Esq. attorneys
         esq_attorneys = []
         for pattern in self.attorney_patterns['esq_titles']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 name = self._clean_name(match.group(1))
                 if self._is_valid_attorney_name(name):
@@ -368,7 +576,7 @@ class ComprehensiveADREProcessor:
         
         # Extract Assistant Attorney General
         for pattern in self.attorney_patterns['aag']:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 name = self._clean_name(match.group(1))
                 if self._is_valid_attorney_name(name):
@@ -377,18 +585,19 @@ class ComprehensiveADREProcessor:
                         case.petitioner_attorney = name
                     break
         
-        # Check for pro se representation
-        if re.search(r'(?:appearing\s+)?pro\s+se|self[\-\s]represented', text, re.IGNORECASE):
+        # Check for pro se representation (only matters for unrepresented sides)
+        unrepresented = not case.petitioner_attorney or not case.respondent_attorney
+        if unrepresented and _PRO_SE_RE.search(text):
             if not case.petitioner_attorney:
                 case.pro_se_parties.append("petitioner")
             if not case.respondent_attorney:
                 case.pro_se_parties.append("respondent")
     
-    def _extract_judges(self, case: ComprehensiveADRECase, text: str, text_lines: List[str]):
+    def _extract_judges(self, case: ComprehensiveADRECase, text: str):
         """Extract judge information."""
         # Extract Administrative Law Judge
         for pattern in self.judge_patterns['alj']:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            match = pattern.search(text)
             if match:
                 name = self._clean_name(match.group(1))
                 if self._is_valid_judge_name(name):
@@ -399,100 +608,107 @@ class ComprehensiveADREProcessor:
         # Extract other judges/hearing officers
         if not case.judge_name:
             for pattern in self.judge_patterns['judge']:
-                match = re.search(pattern, text, re.IGNORECASE)
+                match = pattern.search(text)
                 if match:
                     name = self._clean_name(match.group(1))
                     if self._is_valid_judge_name(name):
                         case.judge_name = name
-                        if 'hearing officer' in pattern.lower():
+                        if 'hearing officer' in pattern.pattern.lower():
                             case.hearing_officer = name
                         break
     
     def _extract_legal_violations(self, case: ComprehensiveADRECase, text: str):
         """Extract statutory and regulatory violations."""
+        statutes_violated = case.statutes_violated
+        
         # Extract A.R.S. violations
-        for pattern in self.violation_patterns['ars']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                statute = f"A.R.S. § {match.group(1)}"
-                if statute not in case.ars_violations:
-                    case.ars_violations.append(statute)
-                    case.statutes_violated.append(statute)
+        ars_violations = case.ars_violations
+        seen = set(ars_violations)
+        for match in self.violation_patterns['ars'].finditer(text):
+            statute = f"A.R.S. § {match.group(1)}"
+            if statute not in seen:
+                seen.add(statute)
+                ars_violations.append(statute)
+                statutes_violated.append(statute)
         
         # Extract A.A.C. violations
-        for pattern in self.violation_patterns['aac']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                regulation = f"A.A.C. R{match.group(1)}"
-                if regulation not in case.aac_violations:
-                    case.aac_violations.append(regulation)
-                    case.statutes_violated.append(regulation)
+        aac_violations = case.aac_violations
+        seen = set(aac_violations)
+        for match in self.violation_patterns['aac'].finditer(text):
+            regulation = f"A.A.C. R{match.group(1)}"
+            if regulation not in seen:
+                seen.add(regulation)
+                aac_violations.append(regulation)
+                statutes_violated.append(regulation)
     
     def _extract_hoa_violations(self, case: ComprehensiveADRECase, text: str):
         """Extract HOA governing document violations."""
+        governing_doc_violations = case.governing_doc_violations
         for doc_type, patterns in self.hoa_violation_patterns.items():
+            target_list = getattr(case, f"{doc_type}_violations")
+            seen = set(target_list)
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 for match in matches:
                     section = match.group(1) if match.groups() and match.group(1) else "general"
                     violation = f"{doc_type.upper()} Section {section}" if section != "general" else doc_type.upper()
                     
-                    target_list = getattr(case, f"{doc_type}_violations")
-                    if violation not in target_list:
+                    if violation not in seen:
+                        seen.add(violation)
                         target_list.append(violation)
-                        case.governing_doc_violations.append(violation)
+                        governing_doc_violations.append(violation)
     
     def _extract_penalties_and_orders(self, case: ComprehensiveADRECase, text: str):
         """Extract penalties and compliance orders."""
+        penalties = case.penalties
+        
         # Extract monetary fines
+        monetary_fines = case.monetary_fines
+        seen = set(monetary_fines)
         for pattern in self.penalty_patterns['monetary_fine']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 amount = match.group(1)
                 fine = f"${amount}"
-                if fine not in case.monetary_fines:
-                    case.monetary_fines.append(fine)
-                    case.penalties.append(f"Monetary fine: {fine}")
+                if fine not in seen:
+                    seen.add(fine)
+                    monetary_fines.append(fine)
+                    penalties.append(f"Monetary fine: {fine}")
         
         # Extract compliance orders
-        for pattern in self.penalty_patterns['compliance_order']:
-            if re.search(pattern, text, re.IGNORECASE):
-                compliance = "Compliance order issued"
-                if compliance not in case.compliance_orders:
-                    case.compliance_orders.append(compliance)
-                    case.penalties.append(compliance)
+        compliance = "Compliance order issued"
+        if (compliance not in case.compliance_orders
+                and any(pattern.search(text) for pattern in self.penalty_patterns['compliance_order'])):
+            case.compliance_orders.append(compliance)
+            penalties.append(compliance)
         
         # Extract cease and desist orders
-        for pattern in self.penalty_patterns['cease_desist']:
-            if re.search(pattern, text, re.IGNORECASE):
-                cease_desist = "Cease and desist order"
-                if cease_desist not in case.cease_desist_orders:
-                    case.cease_desist_orders.append(cease_desist)
-                    case.penalties.append(cease_desist)
+        cease_desist = "Cease and desist order"
+        if (cease_desist not in case.cease_desist_orders
+                and any(pattern.search(text) for pattern in self.penalty_patterns['cease_desist'])):
+            case.cease_desist_orders.append(cease_desist)
+            penalties.append(cease_desist)
     
     def _extract_outcomes(self, case: ComprehensiveADRECase, text: str):
         """Extract case outcomes and decisions."""
-        # Extract findings of fact
-        findings_pattern = r'(?:FINDING|FACT)\s*(?:OF\s+FACT\s*)?#?\s*(\d+)[:\.]?\s*([^.\n]+(?:\.[^.\n]+)*\.)'
-        for match in re.finditer(findings_pattern, text, re.IGNORECASE):
-            finding = f"Finding {match.group(1)}: {match.group(2).strip()[:200]}"
-            case.findings_of_fact.append(finding)
-        
-        # Extract conclusions of law
-        conclusions_pattern = r'(?:CONCLUSION|LAW)\s*(?:OF\s+LAW\s*)?#?\s*(\d+)[:\.]?\s*([^.\n]+(?:\.[^.\n]+)*\.)'
-        for match in re.finditer(conclusions_pattern, text, re.IGNORECASE):
-            conclusion = f"Conclusion {match.group(1)}: {match.group(2).strip()[:200]}"
-            case.conclusions_of_law.append(conclusion)
+        # Extract findings of fact and conclusions of law
+        findings, conclusions = case.findings_of_fact, case.conclusions_of_law
+        anchor = _FINDINGS_ANCHOR_RE.search(text)
+        finding_end = conclusion_end = anchor.start() if anchor else 0
+        for match in _OUTCOMES_RE.finditer(text, finding_end):
+            if match.group('finding') is not None:
+                if match.start() >= finding_end:
+                    finding_end = match.end('finding')
+                    finding = f"Finding {match.group('finding_num')}: {match.group('finding').strip()[:200]}"
+                    findings.append(finding)
+            elif match.start() >= conclusion_end:
+                conclusion_end = match.end('conclusion')
+                conclusion = f"Conclusion {match.group('conclusion_num')}: {match.group('conclusion').strip()[:200]}"
+                conclusions.append(conclusion)
         
         # Extract orders
-        order_patterns = [
-            r'IT\s+IS\s+(?:HEREBY\s+)?ORDERED\s+(?:THAT\s+)?([^.]+(?:\.[^.]+)*\.)',
-            r'ORDERS?\s*:\s*\n([^.]+(?:\.[^.]+)*\.)',
-            r'(?:HEREBY\s+)?ORDERS?\s+(?:AS\s+FOLLOWS\s*:?\s*)?([^.]+(?:\.[^.]+)*\.)'
-        ]
-        
-        for pattern in order_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _ORDER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 order_text = match.group(1).strip()[:300]
                 case.orders.append(order_text)
@@ -508,20 +724,11 @@ class ComprehensiveADREProcessor:
     
     def _extract_dates(self, case: ComprehensiveADRECase, text: str):
         """Extract relevant dates."""
-        from dateutil import parser as date_parser
-        
-        date_patterns = [
-            (r'(?:hearing|heard)\s+on\s+(\w+\s+\d{1,2},?\s+\d{4})', 'hearing'),
-            (r'(?:dated?|issued?)\s+(?:this\s+)?(\w+\s+\d{1,2},?\s+\d{4})', 'decision'),
-            (r'(?:filed?\s+on\s+|filing\s+date:?\s*)(\w+\s+\d{1,2},?\s+\d{4})', 'filing'),
-            (r'(\d{1,2}/\d{1,2}/\d{4})', 'general')
-        ]
-        
-        for pattern, date_type in date_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern, date_type in _DATE_PATTERNS:
+            for match in pattern.finditer(text):
                 try:
                     date_str = match.group(1)
-                    parsed_date = date_parser.parse(date_str)
+                    parsed_date = _parse_date(date_str)
                     
                     if date_type == 'hearing':
                         case.hearing_date = parsed_date
@@ -536,19 +743,21 @@ class ComprehensiveADREProcessor:
                             case.hearing_date = parsed_date
                         elif ('decision' in context or 'order' in context) and not case.decision_date:
                             case.decision_date = parsed_date
-                except:
+                except (ValueError, OverflowError):
                     continue
     
     def _classify_document(self, case: ComprehensiveADRECase, text: str):
         """Classify document type and set authority weight."""
-        text_upper = text.upper()
-        
-        for doc_type, indicators in self.doc_type_indicators.items():
-            for indicator in indicators:
-                if indicator in text_upper:
-                    case.document_type = doc_type
-                    case.decision_type = doc_type
-                    break
+        if text.isascii() or not any(char in text for char in _UPPER_TO_ASCII):
+            haystack = text.encode('ascii', 'replace').lower()
+            needles = self._doc_type_byte_needles
+        else:
+            haystack, needles = text.upper(), self._doc_type_needles
+        for doc_type, indicators in needles:
+            if any(indicator in haystack for indicator in indicators):
+                case.document_type = doc_type
+                case.decision_type = doc_type
+                break
         
         # Set authority weight based on document type
         if case.document_type in ['final_order', 'decision_and_order']:
@@ -564,43 +773,23 @@ class ComprehensiveADREProcessor:
     
     def _extract_case_number_from_filename(self, filename: str) -> str:
         """Extract case number from filename."""
-        match = re.search(r'(\d{2}[A-Z]\-[A-Z]\d+(?:\-REL)?(?:\-RHG)?)', filename)
+        match = _FILENAME_CASE_RE.search(filename)
         return match.group(1) if match else filename.replace('.docx', '').replace('.doc', '')
     
-    def _clean_name(self, name: str) -> str:
-        """Clean and normalize name."""
-        name = ' '.join(name.split())
-        name = name.rstrip('.,;:')
-        return name.title()
-    
-    def _is_valid_party_name(self, name: str) -> bool:
-        """Validate party name."""
-        if not name or len(name) < 3:
-            return False
-        
-        invalid_terms = ['respondent', 'petitioner', 'complainant', 'matter', 'case', 'docket']
-        return not any(term in name.lower() for term in invalid_terms)
-    
-    def _is_valid_attorney_name(self, name: str) -> bool:
-        """Validate attorney name."""
-        if not name or len(name) < 5:
-            return False
-        
-        parts = name.split()
-        if len(parts) < 2:
-            return False
-        
-        invalid_terms = ['copy', 'order', 'decision', 'arizona', 'department', 'transmitted']
-        return not any(term.lower() in name.lower() for term in invalid_terms)
-    
-    def _is_valid_judge_name(self, name: str) -> bool:
-        """Validate judge name."""
-        if not name or len(name) < 5:
-            return False
-        
-        parts = name.split()
-        if len(parts) < 2:
-            return False
-        
-        invalid_terms = ['copy', 'order', 'decision', 'arizona', 'department', 'transmitted', 'page']
-        return not any(term.lower() in name.lower() for term in invalid_terms)
\ No newline at end of file
+    # Name cleanup and validation run once per candidate match; they are
+    # plain module functions so calls skip method binding.
+    _clean_name = staticmethod(clean_name)
+    _is_valid_party_name = staticmethod(is_valid_party_name)
+    _is_valid_attorney_name = staticmethod(is_valid_attorney_name)
+    _is_valid_judge_name = staticmethod(is_valid_judge_name)
+
+
+_processor: Optional[ComprehensiveADREProcessor] = None
+
+
+def get_processor() -> ComprehensiveADREProcessor:
+    """Return the shared processor instance, creating it on first use."""
+    global _processor
+    if _processor is None:
+        _processor = ComprehensiveADREProcessor()
+    return _processor
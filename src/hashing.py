@@ -0,0 +1,18 @@
+"""File hashing shared by the ingest scripts."""
+
+from __future__ import annotations
+import hashlib
+from pathlib import Path
+
+
+def sha256(path: Path, block_size: int = 1 << 20) -> str:
+    """Return the file's SHA-256 hex digest.
+    
+    The file is hashed in blocks so large PDFs are never held in memory
+    whole.
+    """
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
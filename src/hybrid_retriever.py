@@ -1,13 +1,176 @@
 """Hybrid retriever that handles case numbers and metadata searches better."""
 
 import re
-from typing import List, Dict, Any, Optional
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Sequence, Tuple
 from langchain.schema import Document
 from langchain_core.retrievers import BaseRetriever
 from langchain_openai import OpenAIEmbeddings
 from langchain_chroma import Chroma
 from .config import EMBED_MODEL, OPENAI_API_KEY
 
+# Query patterns, compiled once at import
+# ADRE case number. A "case number" prefix or a bare number without the
+# -REL/-RHG suffix needs no separate pattern: the same text always matches
+# here first, with the same capture.
+_CASE_NUMBER_RE = re.compile(r'\b(\d{2}[A-Z]-[A-Z]\d+(?:-REL)?(?:-RHG)?)\b', re.IGNORECASE)
+# Attorney name patterns
+_ATTORNEY_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'attorney\s+([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+)',
+        r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+),?\s+(?:Esq|attorney)',
+        r'lawyer\s+([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+)',
+    )
+]
+
+
+# Collection metadata keyed by (collection id, document count). Collections
+# only change on ingest, which changes the count or clears the cache. Each
+# entry holds the raw metadata and, once a case search needs it, its index.
+_COLLECTION_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+# Separates sources in the joined search text; never part of a case number
+_SOURCE_SEPARATOR = '\0'
+
+
+def _collection_entry(collection) -> Dict[str, Any]:
+    """Return the cache entry for the collection's current contents."""
+    collection_id = str(collection.id)
+    key = (collection_id, collection.count())
+    entry = _COLLECTION_CACHE.get(key)
+    if entry is None:
+        # Drop snapshots taken before the collection last changed
+        for stale in [k for k in _COLLECTION_CACHE if k[0] == collection_id]:
+            del _COLLECTION_CACHE[stale]
+        entry = {'data': collection.get(include=['metadatas']), 'index': None}
+        _COLLECTION_CACHE[key] = entry
+    return entry
+
+
+def get_collection_metadatas(collection) -> Dict[str, list]:
+    """Return ``collection.get(include=['metadatas'])``, cached between queries."""
+    return _collection_entry(collection)['data']
+
+
+def _build_case_index(data: Dict[str, list]) -> Dict[str, Any]:
+    """Index chunk sources and stored case numbers for case searches."""
+    metadatas = data['metadatas']
+    # Uppercased so mixed-case filenames match; offsets below use these
+    # strings, since upper() can change a string's length
+    sources = [metadata.get('source', '').upper() for metadata in metadatas]
+    
+    # Start offset of each row's source in the joined text
+    starts = []
+    offset = 0
+    for source in sources:
+        starts.append(offset)
+        offset += len(source) + 1
+    
+    by_case_number: Dict[str, List[int]] = {}
+    for row, metadata in enumerate(metadatas):
+        stored = metadata.get('case_number')
+        if stored:
+            by_case_number.setdefault(stored.upper(), []).append(row)
+    
+    return {
+        'text': _SOURCE_SEPARATOR.join(sources),
+        'starts': starts,
+        'by_case_number': by_case_number,
+        'priorities': [metadata.get('chunk_priority', 999) for metadata in metadatas],
+    }
+
+
+def find_case_chunks(collection, source_keys: Sequence[str],
+                     case_number: Optional[str] = None) -> List[str]:
+    """Return ids of chunks for a case, best ``chunk_priority`` first.
+    
+    A chunk matches when any of ``source_keys`` occurs in its source or, if
+    given, ``case_number`` equals its stored case number, ignoring case (all
+    keys must be passed uppercase, as the query extractors return them).
+    Sources are searched as one joined string with ``str.find``, so each key
+    is a single C-level scan rather than a Python loop over every row. Ties
+    keep storage order.
+    """
+    entry = _collection_entry(collection)
+    index = entry['index']
+    if index is None:
+        index = entry['index'] = _build_case_index(entry['data'])
+    
+    text, starts = index['text'], index['starts']
+    rows = set(index['by_case_number'].get(case_number, ())) if case_number else set()
+    for source_key in dict.fromkeys(source_keys):
+        if not source_key:
+            continue
+        position = text.find(source_key)
+        while position != -1:
+            row = bisect_right(starts, position) - 1
+            rows.add(row)
+            # One hit per row is enough; resume at the next source
+            if row + 1 == len(starts):
+                break
+            position = text.find(source_key, starts[row + 1])
+    
+    priorities = index['priorities']
+    ordered = sorted(sorted(rows), key=priorities.__getitem__)
+    ids = entry['data']['ids']
+    return [ids[row] for row in ordered]
+
+
+def clear_collection_cache():
+    """Forget all cached collection metadata (call after ingesting)."""
+    _COLLECTION_CACHE.clear()
+
+
+# Query embeddings keyed by (model, query), most recently used last
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+_QUERY_EMBEDDING_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, ...]]" = OrderedDict()
+_QUERY_EMBEDDING_LOCK = threading.Lock()
+
+
+def embed_query_cached(embeddings: OpenAIEmbeddings, query: str) -> List[float]:
+    """Embed a query, reusing the vector for repeated identical queries."""
+    key = (embeddings.model, query)
+    with _QUERY_EMBEDDING_LOCK:
+        vector = _QUERY_EMBEDDING_CACHE.get(key)
+        if vector is not None:
+            _QUERY_EMBEDDING_CACHE.move_to_end(key)
+            return list(vector)
+    
+    vector = tuple(embeddings.embed_query(query))
+    with _QUERY_EMBEDDING_LOCK:
+        _QUERY_EMBEDDING_CACHE[key] = vector
+        _QUERY_EMBEDDING_CACHE.move_to_end(key)
+        if len(_QUERY_EMBEDDING_CACHE) > QUERY_EMBEDDING_CACHE_SIZE:
+            _QUERY_EMBEDDING_CACHE.popitem(last=False)
+    return list(vector)
+
+
+def fan_out_search(targets: Dict[str, Any], search: Callable[[Any], List[Document]],
+                   error_message: str) -> List[Document]:
+    """Run ``search(target)`` for every project concurrently.
+    
+    Searches are network-bound (embedding + vector store), so they overlap in
+    threads. Results are concatenated in project order; a failing project is
+    reported with ``error_message`` (formatted with ``project`` and ``e``)
+    and skipped.
+    """
+    if not targets:
+        return []
+    
+    all_docs = []
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = [(project, executor.submit(search, target)) for project, target in targets.items()]
+        for project, future in futures:
+            try:
+                all_docs.extend(future.result())
+            except Exception as e:
+                print(error_message.format(project=project, e=e))
+    return all_docs
+
+
 class HybridLegalRetriever(BaseRetriever):
     """Hybrid retriever that combines metadata and semantic search."""
     
@@ -54,31 +217,13 @@ class HybridLegalRetriever(BaseRetriever):
     
     def _extract_case_number(self, query: str) -> Optional[str]:
         """Extract case number from query."""
-        # ADRE case number patterns
-        patterns = [
-            r'\b(\d{2}[A-Z]-[A-Z]\d+(?:-REL)?(?:-RHG)?)\b',
-            r'\bcase\s+(?:number\s+)?(\d{2}[A-Z]-[A-Z]\d+(?:-REL)?(?:-RHG)?)\b',
-            r'\b(\d{2}[A-Z]-[A-Z]\d+)\b'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                return match.group(1).upper()
-        
-        return None
+        match = _CASE_NUMBER_RE.search(query)
+        return match.group(1).upper() if match else None
     
     def _extract_attorney_name(self, query: str) -> Optional[str]:
         """Extract attorney name from query."""
-        # Look for attorney name patterns
-        attorney_patterns = [
-            r'attorney\s+([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+)',
-            r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+),?\s+(?:Esq|attorney)',
-            r'lawyer\s+([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?[A-Z][a-z]+)'
-        ]
-        
-        for pattern in attorney_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        for pattern in _ATTORNEY_PATTERNS:
+            match = pattern.search(query)
             if match:
                 return match.group(1)
         
@@ -88,66 +233,81 @@ class HybridLegalRetriever(BaseRetriever):
         """Search by case number in filename/metadata."""
         all_docs = []
         
+        # Sources match on the full case number or, for -REL numbers, on
+        # the number without the suffix. Neither key covers the other:
+        # "21A-H001-RHG" does not occur in "21A-H001-REL-RHG.pdf".
+        source_keys = (case_number, case_number.replace('-REL', ''))
+        
         for project, db in self.databases.items():
+            if len(all_docs) >= k:
+                break
+            
             try:
-                # Get all documents and filter by filename
+                # Match on cached metadata only; source is matched by
+                # substring, which Chroma's where filters cannot express
                 collection = db._collection
-                all_data = collection.get(include=['documents', 'metadatas'])
-                
-                matching_docs = []
-                for i, metadata in enumerate(all_data['metadatas']):
-                    source = metadata.get('source', '')
-                    stored_case = metadata.get('case_number', '')
-                    
-                    # Check filename or stored case number
-                    if (case_number in source or 
-                        case_number == stored_case or
-                        case_number.replace('-REL', '') in source):
-                        
-                        doc = Document(
-                            page_content=all_data['documents'][i],
-                            metadata=metadata
-                        )
-                        
-                        # Add priority for better chunks
-                        priority = metadata.get('chunk_priority', 999)
-                        matching_docs.append((priority, doc))
+                matching_ids = find_case_chunks(collection, source_keys, case_number)
+                if not matching_ids:
+                    continue
                 
-                # Sort by priority and add to results
-                matching_docs.sort(key=lambda x: x[0])
-                all_docs.extend([doc for _, doc in matching_docs])
+                # Load text only for chunks that are returned
+                top_ids = matching_ids[:k - len(all_docs)]
+                top_data = collection.get(ids=top_ids, include=['documents', 'metadatas'])
+                by_id = dict(zip(top_data['ids'], zip(top_data['documents'], top_data['metadatas'])))
+                all_docs.extend(
+                    Document(page_content=by_id[doc_id][0], metadata=by_id[doc_id][1])
+                    for doc_id in top_ids
+                )
                 
             except Exception as e:
                 print(f"Error searching {project}: {e}")
         
         return all_docs[:k]
     
+    def _embed_query(self, query: str) -> Optional[List[float]]:
+        """Embed a query for vector search, or None if embedding fails."""
+        try:
+            return embed_query_cached(self.embeddings, query)
+        except Exception as e:
+            print(f"Error embedding query: {e}")
+            return None
+    
     def _search_by_attorney(self, attorney_name: str, k: int) -> List[Document]:
         """Search for documents mentioning specific attorney."""
-        all_docs = []
+        if not self.databases:
+            return []
         
-        for project, db in self.databases.items():
-            try:
-                # Use semantic search for attorney name
-                results = db.similarity_search(attorney_name, k=k//len(self.databases))
-                all_docs.extend(results)
-            except Exception as e:
-                print(f"Error searching {project} for attorney: {e}")
+        # Use semantic search for attorney name, embedding it once for all projects
+        query_vector = self._embed_query(attorney_name)
+        if query_vector is None:
+            return []
+        
+        project_k = k // len(self.databases)
+        all_docs = fan_out_search(
+            self.databases,
+            lambda db: db.similarity_search_by_vector(query_vector, k=project_k),
+            "Error searching {project} for attorney: {e}",
+        )
         
         return all_docs[:k]
     
     def _semantic_search(self, query: str, k: int) -> List[Document]:
         """Standard semantic search across all projects."""
-        all_docs = []
+        if not self.databases:
+            return []
         
-        for project, db in self.databases.items():
-            try:
-                # Distribute k across projects
-                project_k = max(1, k // len(self.databases))
-                results = db.similarity_search(query, k=project_k)
-                all_docs.extend(results)
-            except Exception as e:
-                print(f"Error in semantic search for {project}: {e}")
+        # Embed once; every project shares the same embedding model
+        query_vector = self._embed_query(query)
+        if query_vector is None:
+            return []
+        
+        # Distribute k across projects
+        project_k = max(1, k // len(self.databases))
+        all_docs = fan_out_search(
+            self.databases,
+            lambda db: db.similarity_search_by_vector(query_vector, k=project_k),
+            "Error in semantic search for {project}: {e}",
+        )
         
         return all_docs[:k]
 
@@ -1,19 +1,44 @@
 """Simple hybrid search implementation for case numbers."""
 
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from langchain.schema import Document
 from langchain_openai import OpenAIEmbeddings
 from langchain_chroma import Chroma
 from .config import EMBED_MODEL, OPENAI_API_KEY
+from .hybrid_retriever import embed_query_cached, fan_out_search, find_case_chunks
+
+# ADRE case number, compiled once at import
+_CASE_NUMBER_RE = re.compile(r'\b(\d{2}[A-Z]-[A-Z]\d+(?:-REL)?(?:-RHG)?)\b', re.IGNORECASE)
+
+# Open vector stores keyed by (project, root_dir), reused across queries
+_DB_CACHE: Dict[Tuple[str, str], Chroma] = {}
+
+
+def _get_db(project: str, root_dir, embeddings: OpenAIEmbeddings) -> Chroma:
+    """Return the project's vector store, opening it on first use."""
+    key = (project, str(root_dir))
+    db = _DB_CACHE.get(key)
+    if db is None:
+        db = Chroma(
+            persist_directory=str(root_dir / project),
+            collection_name=project,
+            embedding_function=embeddings
+        )
+        _DB_CACHE[key] = db
+    return db
+
+
+def clear_db_cache():
+    """Forget all open vector stores (call after rebuilding an index)."""
+    _DB_CACHE.clear()
 
 
 def search_with_case_number_priority(projects: List[str], root_dir, query: str, k: int = 6) -> List[Document]:
     """Search with priority for case numbers."""
     
     # Check for case number patterns
-    case_number_pattern = r'\b(\d{2}[A-Z]-[A-Z]\d+(?:-REL)?(?:-RHG)?)\b'
-    case_match = re.search(case_number_pattern, query, re.IGNORECASE)
+    case_match = _CASE_NUMBER_RE.search(query)
     
     embeddings = OpenAIEmbeddings(model=EMBED_MODEL, openai_api_key=OPENAI_API_KEY)
     
@@ -24,31 +49,21 @@ def search_with_case_number_priority(projects: List[str], root_dir, query: str,
         # Search for exact filename matches first
         for project in projects:
             try:
-                db = Chroma(
-                    persist_directory=str(root_dir / project),
-                    collection_name=project,
-                    embedding_function=embeddings
-                )
+                db = _get_db(project, root_dir, embeddings)
                 
-                # Get documents by filename
+                # Match filenames on (cached) metadata, then load only the top chunks
                 collection = db._collection
-                all_data = collection.get(include=['documents', 'metadatas'])
-                
-                matching_docs = []
-                for i, metadata in enumerate(all_data['metadatas']):
-                    source = metadata.get('source', '')
-                    if case_number in source:
-                        doc = Document(
-                            page_content=all_data['documents'][i],
-                            metadata=metadata
-                        )
-                        priority = metadata.get('chunk_priority', 999)
-                        matching_docs.append((priority, doc))
+                matching_ids = find_case_chunks(collection, (case_number,))
                 
-                if matching_docs:
-                    # Sort by priority and return top results
-                    matching_docs.sort(key=lambda x: x[0])
-                    result_docs = [doc for _, doc in matching_docs[:k]]
+                if matching_ids:
+                    # Already sorted by priority; return top results
+                    top_ids = matching_ids[:k]
+                    top_data = collection.get(ids=top_ids, include=['documents', 'metadatas'])
+                    by_id = dict(zip(top_data['ids'], zip(top_data['documents'], top_data['metadatas'])))
+                    result_docs = [
+                        Document(page_content=by_id[doc_id][0], metadata=by_id[doc_id][1])
+                        for doc_id in top_ids
+                    ]
                     print(f"Found {len(result_docs)} chunks from exact case file")
                     return result_docs
                     
@@ -57,18 +72,23 @@ def search_with_case_number_priority(projects: List[str], root_dir, query: str,
     
     # Fallback to semantic search
     print("Using semantic search fallback")
-    all_docs = []
-    for project in projects:
-        try:
-            db = Chroma(
-                persist_directory=str(root_dir / project),
-                collection_name=project,
-                embedding_function=embeddings
-            )
-            results = db.similarity_search(query, k=k//len(projects))
-            all_docs.extend(results)
-        except Exception as e:
-            print(f"Error in semantic search for {project}: {e}")
+    
+    # Embed once and reuse the vector for every project
+    try:
+        query_vector = embed_query_cached(embeddings, query)
+    except Exception as e:
+        print(f"Error embedding query: {e}")
+        return []
+    
+    def search_project(project: str) -> List[Document]:
+        db = _get_db(project, root_dir, embeddings)
+        return db.similarity_search_by_vector(query_vector, k=k//len(projects))
+    
+    all_docs = fan_out_search(
+        {project: project for project in projects},
+        search_project,
+        "Error in semantic search for {project}: {e}",
+    )
     
     return all_docs[:k]
 
@@ -13,9 +13,11 @@
 from __future__ import annotations   # must stay first!
 
 # ── stdlib ────────────────────────────────────────────────────────────────
-import argparse, hashlib, logging, os
+import argparse, hashlib, json, logging, os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Sequence, Dict, List
+from typing import Sequence, Dict, List, Optional, Tuple
 
 logging.getLogger("pdfminer").setLevel(logging.ERROR)   # kill colour-space spam
 os.environ["SCARF_NO_ANALYTICS"] = "true"               # disable telemetry
@@ -34,16 +36,66 @@ from langchain_chroma import Chroma
 # ── local ─────────────────────────────────────────────────────────────────
 from .config import INDEX_DIR, EMBED_MODEL
 from .logger import get_logger
-from .legal_processor import LegalDocumentProcessor
-from .legal_metadata import LegalDocumentMetadata, MetadataExtractor, MetadataIndex
+from .legal_processor import get_legal_processor
+from .legal_metadata import LegalDocumentMetadata, MetadataIndex, get_metadata_extractor
+from .hybrid_retriever import clear_collection_cache
+from .hashing import sha256
 
 LOGGER = get_logger(__name__)
 
+# Chunks per embedding request / collection write, and requests in flight
+EMBED_BATCH_SIZE = 512
+EMBED_WORKERS = 4
+# Concurrent requests hit rate limits more often; the OpenAI client retries
+# 429s and transient errors with exponential backoff (honouring Retry-After)
+EMBED_MAX_RETRIES = 6
+
+# Sidecar cache of {path: [size, mtime_ns, sha256]} in each project dir
+FILE_INDEX_NAME = ".fileindex.json"
+
 # ── helper funcs ──────────────────────────────────────────────────────────
-def sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    h.update(path.read_bytes())
-    return h.hexdigest()
+def hash_files(files: List[Path], index_path: Path) -> List[str]:
+    """Return each file's SHA-256, re-reading only files that changed.
+    
+    A file whose size and mtime match its entry in the sidecar index keeps
+    the stored digest; the rest are hashed concurrently (hashlib releases
+    the GIL on large blocks) and the index is rewritten.
+    """
+    try:
+        with index_path.open() as f:
+            known = json.load(f)
+    except (OSError, ValueError):
+        known = {}
+    
+    keys = [str(path.resolve()) for path in files]
+    stats = [path.stat() for path in files]
+    digests: List[Optional[str]] = []
+    for key, st in zip(keys, stats):
+        entry = known.get(key)
+        unchanged = entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns
+        digests.append(entry[2] if unchanged else None)
+    
+    stale = [i for i, digest in enumerate(digests) if digest is None]
+    if stale:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for i, digest in zip(stale, executor.map(sha256, [files[i] for i in stale])):
+                digests[i] = digest
+    
+    # Keep entries for files outside this run (a project can be fed from
+    # several directories)
+    index = dict(known)
+    index.update(
+        (key, [st.st_size, st.st_mtime_ns, digest])
+        for key, st, digest in zip(keys, stats, digests)
+    )
+    if index != known:
+        try:
+            with index_path.open("w") as f:
+                json.dump(index, f)
+        except OSError as e:
+            LOGGER.warning("Could not save file index %s: %s", index_path, e)
+    LOGGER.info("Hashed %d of %d files (others unchanged since last run)", len(stale), len(files))
+    return digests
 
 
 def load_pdf(path: Path, *, strategy: str = "fast") -> Sequence[str]:
@@ -55,6 +107,70 @@ def load_pdf(path: Path, *, strategy: str = "fast") -> Sequence[str]:
     ]
 
 
+def extract_texts(path: Path) -> List[str]:
+    """Return the non-blank text elements of a PDF or Word document."""
+    if path.suffix.lower() == ".pdf":
+        texts = load_pdf(path)
+    else:  # .docx / .doc
+        try:
+            # Try with metadata extraction disabled
+            from unstructured.partition.docx import partition_docx
+            elements = partition_docx(
+                filename=str(path),
+                metadata_filename=None,
+                include_metadata=False
+            )
+            texts = [el.text for el in elements if el.text and not el.text.isspace()]
+        except Exception as e:
+            LOGGER.warning(f"Error loading {path} with unstructured: {e}")
+            # Fallback to simple docx extraction
+            try:
+                import docx
+                doc = docx.Document(str(path))
+                texts = [para.text for para in doc.paragraphs if para.text and not para.text.isspace()]
+            except Exception as e2:
+                LOGGER.error(f"Failed to load {path} with both methods: {e2}")
+                texts = []  # Skip this file
+    return texts
+
+
+def analyze_document(
+    path: Path, digest: str, enable_legal_processing: bool
+) -> Tuple[List[str], Optional[LegalDocumentMetadata], List[Dict]]:
+    """Parse a document and run legal analysis on it (worker-process entry).
+    
+    Returns the text elements, the document's legal metadata and its
+    hierarchical chunks; the last two are None and [] when legal processing
+    is disabled or the document has no text.
+    """
+    texts = extract_texts(path)
+    # Combine all text for legal analysis
+    full_text = "\n".join(texts)
+    if not (enable_legal_processing and full_text):
+        return texts, None, []
+    
+    # Shared per-process instances: patterns are built once per worker
+    legal_processor = get_legal_processor()
+    metadata_extractor = get_metadata_extractor()
+    
+    # Both passes share one lowercased copy of the text
+    full_text_lower = full_text.lower()
+    
+    # Classify document and extract legal information
+    doc_info = legal_processor.classify_document(
+        full_text, path.name, text_lower=full_text_lower
+    )
+    
+    # Extract comprehensive metadata
+    legal_metadata = metadata_extractor.extract_from_text(
+        full_text, path, digest, doc_info, text_lower=full_text_lower
+    )
+    
+    # Create hierarchical chunks for important legal content
+    priority_chunks = legal_processor.create_hierarchical_chunks(full_text, doc_info)
+    return texts, legal_metadata, priority_chunks
+
+
 # ── main ingest ───────────────────────────────────────────────────────────
 def ingest(
     *,
@@ -63,22 +179,23 @@ def ingest(
     root_index: Path = INDEX_DIR,
     chunk_size: int = 800,
     enable_legal_processing: bool = True,
+    max_workers: Optional[int] = None,
 ) -> None:
     proj_dir = root_index / project
     proj_dir.mkdir(parents=True, exist_ok=True)
 
+    embeddings = OpenAIEmbeddings(model=EMBED_MODEL, max_retries=EMBED_MAX_RETRIES)
     db = Chroma(
         persist_directory=str(proj_dir),
         collection_name=project,
-        embedding_function=OpenAIEmbeddings(model=EMBED_MODEL),
+        embedding_function=embeddings,
     )
 
-    existing = {m.get("sha256") for m in db.get()["metadatas"] if "sha256" in m}
+    # Only the digests are needed, so skip loading chunk text
+    existing = {m.get("sha256") for m in db.get(include=["metadatas"])["metadatas"] if "sha256" in m}
 
-    # Initialize legal processors if enabled
+    # Documents are analyzed in worker processes; the index lives here
     if enable_legal_processing:
-        legal_processor = LegalDocumentProcessor()
-        metadata_extractor = MetadataExtractor()
         metadata_index = MetadataIndex(proj_dir)
     
     splitter = RecursiveCharacterTextSplitter(
@@ -91,92 +208,81 @@ def ingest(
         LOGGER.error("No PDF or DOCX files found in %s", pdf_dir)
         return
 
-    for path in tqdm(files, desc="Parsing documents"):
-        digest = sha256(path)
-        if digest in existing:
-            continue
+    # Hash every candidate up front so already-indexed files never reach a
+    # parse worker; unchanged files reuse their digest from the last run
+    digests = hash_files(files, proj_dir / FILE_INDEX_NAME)
+    pending: list[tuple[Path, str]] = []
+    for path, digest in zip(files, digests):
+        if digest not in existing:
+            pending.append((path, digest))
+            # Copies of a file share its digest, and so its metadata entry
+            # and chunk ids: analyzing the first copy covers them all
+            existing.add(digest)
+    LOGGER.info("%d of %d files are new or changed", len(pending), len(files))
 
-        # Extract text
-        if path.suffix.lower() == ".pdf":
-            texts = load_pdf(path)
-        else:  # .docx / .doc
-            try:
-                # Try with metadata extraction disabled
-                from unstructured.partition.docx import partition_docx
-                elements = partition_docx(
-                    filename=str(path),
-                    metadata_filename=None,
-                    include_metadata=False
-                )
-                texts = [el.text for el in elements if el.text and not el.text.isspace()]
-            except Exception as e:
-                LOGGER.warning(f"Error loading {path} with unstructured: {e}")
-                # Fallback to simple docx extraction
-                try:
-                    import docx
-                    doc = docx.Document(str(path))
-                    texts = [para.text for para in doc.paragraphs if para.text and not para.text.isspace()]
-                except Exception as e2:
-                    LOGGER.error(f"Failed to load {path} with both methods: {e2}")
-                    texts = []  # Skip this file
-        
-        # Combine all text for legal analysis
-        full_text = "\n".join(texts)
-        
-        # Legal document processing
-        base_metadata = {"source": path.name, "sha256": digest}
-        
-        if enable_legal_processing and full_text:
-            # Classify document and extract legal information
-            doc_info = legal_processor.classify_document(full_text, path.name)
-            
-            # Extract comprehensive metadata
-            legal_metadata = metadata_extractor.extract_from_text(
-                full_text, path, digest, doc_info
-            )
-            
-            # Add to metadata index
-            metadata_index.add_document(legal_metadata)
-            
-            # Enhance base metadata with legal information
-            base_metadata.update({
-                "document_type": legal_metadata.document_type,
-                "authority_weight": legal_metadata.authority_weight,
-                "is_primary_authority": legal_metadata.is_primary_authority,
-                "case_number": legal_metadata.case_number,
-                "jurisdiction": legal_metadata.jurisdiction,
-            })
-            
-            # Add citations to metadata for search
-            if legal_metadata.statutes_cited:
-                base_metadata["statutes_cited"] = ", ".join(legal_metadata.statutes_cited[:5])
-            if legal_metadata.cases_cited:
-                base_metadata["cases_cited"] = ", ".join(legal_metadata.cases_cited[:5])
-            
-            # Create hierarchical chunks for important legal content
-            priority_chunks = legal_processor.create_hierarchical_chunks(full_text, doc_info)
+    # Parsing and legal analysis are CPU-bound (pdfminer, OCR, regex), so
+    # they run in worker processes; indexing and embedding stay here
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        analyzed = executor.map(
+            analyze_document,
+            [path for path, _ in pending],
+            [digest for _, digest in pending],
+            [enable_legal_processing] * len(pending),
+            chunksize=4,
+        )
+        for (path, digest), (texts, legal_metadata, priority_chunks) in tqdm(
+            zip(pending, analyzed), total=len(pending), desc="Parsing documents"
+        ):
+            # Legal document processing
+            base_metadata = {"source": path.name, "sha256": digest}
+            # Text already stored whole in a hierarchical chunk
+            covered: list[str] = []
             
-            for chunk_info in priority_chunks:
-                chunk_metadata = base_metadata.copy()
-                chunk_metadata.update({
-                    "chunk_priority": chunk_info["priority"],
-                    "chunk_type": chunk_info["type"],
+            if legal_metadata is not None:
+                # Add to metadata index
+                metadata_index.add_document(legal_metadata)
+                
+                # Enhance base metadata with legal information
+                base_metadata.update({
+                    "document_type": legal_metadata.document_type,
+                    "authority_weight": legal_metadata.authority_weight,
+                    "is_primary_authority": legal_metadata.is_primary_authority,
+                    "case_number": legal_metadata.case_number,
+                    "jurisdiction": legal_metadata.jurisdiction,
                 })
+                
+                # Add citations to metadata for search
+                if legal_metadata.statutes_cited:
+                    base_metadata["statutes_cited"] = ", ".join(legal_metadata.statutes_cited[:5])
+                if legal_metadata.cases_cited:
+                    base_metadata["cases_cited"] = ", ".join(legal_metadata.cases_cited[:5])
+                
+                for chunk_info in priority_chunks:
+                    covered.append(chunk_info["content"])
+                    chunk_metadata = base_metadata.copy()
+                    chunk_metadata.update({
+                        "chunk_priority": chunk_info["priority"],
+                        "chunk_type": chunk_info["type"],
+                    })
+                    new_docs.append(
+                        Document(
+                            page_content=chunk_info["content"],
+                            metadata=chunk_metadata,
+                        )
+                    )
+            
+            # Process regular text chunks. Hierarchical chunks are only
+            # excerpts, so raw text is still needed, except for elements a
+            # priority chunk already contains in full.
+            for text in texts:
+                if covered and any(text in content for content in covered):
+                    continue
                 new_docs.append(
                     Document(
-                        page_content=chunk_info["content"],
-                        metadata=chunk_metadata,
+                        page_content=text,
+                        metadata=base_metadata,
                     )
                 )
-        
-        # Process regular text chunks
-        for text in texts:
-            new_docs.append(
-                Document(
-                    page_content=text,
-                    metadata=base_metadata,
-                )
-            )
 
     if not new_docs:
         LOGGER.info("No new documents to embed for project '%s'", project)
@@ -185,19 +291,72 @@ def ingest(
     LOGGER.info("Splitting into chunks …")
     chunks = splitter.split_documents(new_docs)
     
+    # Deterministic ids (file digest + position within the file), so writing
+    # a batch again replaces it instead of duplicating it
+    ordinals: Counter = Counter()
+    chunk_ids: list[str] = []
+    for chunk in chunks:
+        digest = chunk.metadata["sha256"]
+        chunk_ids.append(hashlib.sha1(f"{digest}:{ordinals[digest]}".encode()).hexdigest())
+        ordinals[digest] += 1
+    
     # Sort chunks by priority if legal processing is enabled
     if enable_legal_processing:
-        chunks.sort(
-            key=lambda x: x.metadata.get("chunk_priority", 999)
+        order = sorted(
+            range(len(chunks)), key=lambda i: chunks[i].metadata.get("chunk_priority", 999)
         )
+        chunks = [chunks[i] for i in order]
+        chunk_ids = [chunk_ids[i] for i in order]
     
     LOGGER.info("Embedding %d new chunks", len(chunks))
 
-    # Add documents in batches to avoid memory issues
-    batch_size = 100
-    for i in range(0, len(chunks), batch_size):
-        batch = chunks[i:i + batch_size]
-        db.add_documents(batch)
+    # Boilerplate repeats across legal documents, so each distinct chunk text
+    # is embedded once: in the batch where it first appears
+    batches = [
+        chunks[i:i + EMBED_BATCH_SIZE] for i in range(0, len(chunks), EMBED_BATCH_SIZE)
+    ]
+    id_batches = [
+        chunk_ids[i:i + EMBED_BATCH_SIZE] for i in range(0, len(chunk_ids), EMBED_BATCH_SIZE)
+    ]
+    remaining = Counter(c.page_content for c in chunks)
+    seen: set[str] = set()
+    batch_new_texts: list[list[str]] = []
+    for batch in batches:
+        new_texts = [t for t in dict.fromkeys(c.page_content for c in batch) if t not in seen]
+        seen.update(new_texts)
+        batch_new_texts.append(new_texts)
+    LOGGER.info("Embedding %d distinct texts for %d chunks", len(seen), len(chunks))
+
+    def embed_texts(texts: list[str]) -> list[list[float]]:
+        return embeddings.embed_documents(texts) if texts else []
+
+    # Embed batches concurrently and write each batch straight to the
+    # collection (in order) with its vectors. Vectors for repeated texts are
+    # kept only until their last occurrence has been written.
+    repeated: Dict[str, list[float]] = {}
+    with ThreadPoolExecutor(max_workers=EMBED_WORKERS) as executor:
+        embedded = executor.map(embed_texts, batch_new_texts)
+        for batch, batch_ids, new_texts, new_vectors in zip(
+            batches, id_batches, batch_new_texts, embedded
+        ):
+            repeated.update(zip(new_texts, new_vectors))
+            vectors = []
+            for chunk in batch:
+                text = chunk.page_content
+                vectors.append(repeated[text])
+                remaining[text] -= 1
+                if not remaining[text]:
+                    del repeated[text]
+            # Vectors are precomputed, so the raw collection's upsert is used
+            db._collection.upsert(
+                ids=batch_ids,
+                embeddings=vectors,
+                metadatas=[c.metadata for c in batch],
+                documents=[c.page_content for c in batch],
+            )
+
+    # Retrievers in this process must not reuse pre-ingest metadata
+    clear_collection_cache()
     
     # Save metadata index
     if enable_legal_processing:
@@ -226,6 +385,10 @@ if __name__ == "__main__":
         "--chunk-size", type=int, default=800,
         help="Chunk size for text splitting (default: 800)"
     )
+    ap.add_argument(
+        "--workers", type=int, default=None,
+        help="Parallel document parsing processes (default: CPU count)"
+    )
     args = ap.parse_args()
     
     ingest(
@@ -233,5 +396,6 @@ if __name__ == "__main__":
         project=args.project, 
         root_index=args.root_index,
         chunk_size=args.chunk_size,
-        enable_legal_processing=not args.disable_legal
+        enable_legal_processing=not args.disable_legal,
+        max_workers=args.workers,
     )
@@ -2,12 +2,82 @@
 
 from __future__ import annotations
 import json
+import re
+import sys
+from bisect import bisect_left
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 
-@dataclass
+from .regex_compat import compile_pattern
+
+# ADRE patterns, compiled once at import (with RE2 when it is installed)
+_LICENSE_RE = compile_pattern(r'(?:license|lic\.?)\s*(?:#|no\.?|number)?\s*([A-Z]{2}\d{6}|\d{6})', re.IGNORECASE)
+_FINE_RE = compile_pattern(r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+
+VIOLATION_KEYWORDS = {
+    'misrepresentation': ['misrepresent', 'false statement', 'misleading'],
+    'trust_account': ['trust account', 'escrow', 'client funds'],
+    'unlicensed_activity': ['unlicensed', 'without license', 'license required'],
+    'failure_to_disclose': ['fail to disclose', 'non-disclosure', 'concealment'],
+    'negligence': ['negligent', 'breach of duty', 'standard of care'],
+    'fraud': ['fraud', 'deceptive', 'scheme', 'artifice'],
+}
+
+PENALTY_KEYWORDS = {
+    'revocation': ['revoke', 'revocation'],
+    'suspension': ['suspend', 'suspension'],
+    'probation': ['probation', 'probationary'],
+    'fine': ['fine', 'monetary penalty', 'civil penalty'],
+    'censure': ['censure', 'reprimand'],
+    'education': ['education', 'continuing education', 'CE hours'],
+}
+
+
+def _scan_table(keywords: Dict[str, List[str]]) -> tuple:
+    """Return (category, keywords) pairs without keywords that cannot matter.
+    
+    Keywords are searched for in lowercased text. A category only asks
+    whether any of its keywords occurs, so two kinds are dropped, each
+    saving a full substring scan of the text whenever the category misses:
+    a keyword containing another keyword of the same category
+    (``probationary`` contains ``probation``), and one with ASCII capitals
+    (``CE hours``), which lowercased text can never contain.
+    """
+    return tuple(
+        (category, tuple(
+            keyword for keyword in group
+            if not any(other != keyword and other in keyword for other in group)
+            and not any(char.isascii() and char.isupper() for char in keyword)
+        ))
+        for category, group in keywords.items()
+    )
+
+
+# (document type, or phrase in the text when the type is None, is primary
+# authority, authority weight, court level), in precedence order. Type rules
+# cost nothing; phrase rules scan the text only until one matches. Court
+# phrases outrank the adre_order type, so the table is not split by kind.
+_AUTHORITY_RULES = (
+    ('statute', None, True, 10, None),
+    ('regulation', None, True, 9, None),
+    (None, 'supreme court', True, 8, 'supreme'),
+    (None, 'court of appeals', True, 7, 'appeals'),
+    ('adre_order', None, True, 6, 'administrative'),
+    (None, 'superior court', False, 5, 'superior'),
+)
+
+_VIOLATION_SCAN = _scan_table(VIOLATION_KEYWORDS)
+_PENALTY_SCAN = _scan_table(PENALTY_KEYWORDS)
+
+# Fields holding one of a handful of category names; interned on load so
+# every record shares the same string objects instead of its own JSON copy
+_CATEGORY_FIELDS = ('document_type', 'jurisdiction', 'court_level', 'violation_type')
+
+@dataclass(slots=True)
 class LegalDocumentMetadata:
     """Complete metadata for a legal document."""
     
@@ -51,9 +121,19 @@ class LegalDocumentMetadata:
     date_indexed: datetime = field(default_factory=datetime.now)
     processing_notes: List[str] = field(default_factory=list)
     
+    def all_citations(self) -> List[str]:
+        """Return statute, case and regulation citations as one list."""
+        return [*self.statutes_cited, *self.cases_cited, *self.regulations_cited]
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for storage."""
-        data = asdict(self)
+        """Convert to dictionary for storage.
+        
+        The dict is shallow: list and dict fields are the instance's own
+        objects, which is all JSON serialization needs (``asdict`` would
+        deep-copy every one of them).
+        """
+        # __slots__ lists the fields in declaration order, like fields()
+        data = {name: getattr(self, name) for name in self.__slots__}
         # Convert datetime objects to strings
         for key in ['date_filed', 'date_decided', 'date_effective', 'date_indexed']:
             if data.get(key) and isinstance(data[key], datetime):
@@ -67,6 +147,9 @@ class LegalDocumentMetadata:
         for key in ['date_filed', 'date_decided', 'date_effective', 'date_indexed']:
             if data.get(key) and isinstance(data[key], str):
                 data[key] = datetime.fromisoformat(data[key])
+        for key in _CATEGORY_FIELDS:
+            if isinstance(data.get(key), str):
+                data[key] = sys.intern(data[key])
         return cls(**data)
 
 
@@ -74,27 +157,16 @@ class MetadataExtractor:
     """Extracts comprehensive metadata from legal documents."""
     
     def __init__(self):
-        self.violation_keywords = {
-            'misrepresentation': ['misrepresent', 'false statement', 'misleading'],
-            'trust_account': ['trust account', 'escrow', 'client funds'],
-            'unlicensed_activity': ['unlicensed', 'without license', 'license required'],
-            'failure_to_disclose': ['fail to disclose', 'non-disclosure', 'concealment'],
-            'negligence': ['negligent', 'breach of duty', 'standard of care'],
-            'fraud': ['fraud', 'deceptive', 'scheme', 'artifice'],
-        }
-        
-        self.penalty_keywords = {
-            'revocation': ['revoke', 'revocation'],
-            'suspension': ['suspend', 'suspension'],
-            'probation': ['probation', 'probationary'],
-            'fine': ['fine', 'monetary penalty', 'civil penalty'],
-            'censure': ['censure', 'reprimand'],
-            'education': ['education', 'continuing education', 'CE hours'],
-        }
+        self.violation_keywords = VIOLATION_KEYWORDS
+        self.penalty_keywords = PENALTY_KEYWORDS
     
     def extract_from_text(self, text: str, file_path: Path, sha256: str, 
-                         doc_classification: Dict) -> LegalDocumentMetadata:
-        """Extract comprehensive metadata from document text."""
+                         doc_classification: Dict,
+                         text_lower: Optional[str] = None) -> LegalDocumentMetadata:
+        """Extract comprehensive metadata from document text.
+        
+        ``text_lower`` may pass in an already computed ``text.lower()``.
+        """
         metadata = LegalDocumentMetadata(
             file_path=str(file_path),
             file_name=file_path.name,
@@ -134,87 +206,105 @@ class MetadataExtractor:
                 if len(dates) > 1:
                     metadata.date_decided = dates[-1][1]
         
+        # Lowercase once for both keyword passes
+        if text_lower is None:
+            text_lower = text.lower()
+        
         # Determine authority level
-        metadata = self._determine_authority_level(metadata, text)
+        metadata = self._determine_authority_level(metadata, text, text_lower)
         
         # Extract ADRE-specific information
-        metadata = self._extract_adre_info(metadata, text)
+        metadata = self._extract_adre_info(metadata, text, text_lower)
         
         return metadata
     
     def _determine_authority_level(self, metadata: LegalDocumentMetadata, 
-                                 text: str) -> LegalDocumentMetadata:
+                                 text: str, text_lower: str) -> LegalDocumentMetadata:
         """Determine the authority level of the document."""
-        text_lower = text.lower()
-        
-        # Primary authority detection
-        if metadata.document_type == 'statute':
-            metadata.is_primary_authority = True
-            metadata.authority_weight = 10
-        elif metadata.document_type == 'regulation':
-            metadata.is_primary_authority = True
-            metadata.authority_weight = 9
-        elif 'supreme court' in text_lower:
-            metadata.is_primary_authority = True
-            metadata.authority_weight = 8
-            metadata.court_level = 'supreme'
-        elif 'court of appeals' in text_lower:
-            metadata.is_primary_authority = True
-            metadata.authority_weight = 7
-            metadata.court_level = 'appeals'
-        elif metadata.document_type == 'adre_order':
-            metadata.is_primary_authority = True
-            metadata.authority_weight = 6
-            metadata.court_level = 'administrative'
-        elif 'superior court' in text_lower:
-            metadata.authority_weight = 5
-            metadata.court_level = 'superior'
+        # Primary authority detection: the first matching rule wins
+        for doc_type, phrase, is_primary, weight, court_level in _AUTHORITY_RULES:
+            if doc_type is not None:
+                if metadata.document_type != doc_type:
+                    continue
+            elif phrase not in text_lower:
+                continue
+            if is_primary:
+                metadata.is_primary_authority = True
+            metadata.authority_weight = weight
+            if court_level:
+                metadata.court_level = court_level
+            break
         
         return metadata
     
     def _extract_adre_info(self, metadata: LegalDocumentMetadata, 
-                          text: str) -> LegalDocumentMetadata:
+                          text: str, text_lower: str) -> LegalDocumentMetadata:
         """Extract ADRE-specific information."""
-        text_lower = text.lower()
-        
         # License number extraction
-        import re
-        license_pattern = r'(?:license|lic\.?)\s*(?:#|no\.?|number)?\s*([A-Z]{2}\d{6}|\d{6})'
-        license_match = re.search(license_pattern, text, re.IGNORECASE)
+        license_match = _LICENSE_RE.search(text)
         if license_match:
             metadata.license_number = license_match.group(1)
         
         # Violation type detection
-        for violation_type, keywords in self.violation_keywords.items():
+        for violation_type, keywords in _VIOLATION_SCAN:
             if any(keyword in text_lower for keyword in keywords):
                 metadata.violation_type = violation_type
                 break
         
         # Penalty detection
         penalties = []
-        for penalty_type, keywords in self.penalty_keywords.items():
+        for penalty_type, keywords in _PENALTY_SCAN:
             if any(keyword in text_lower for keyword in keywords):
                 penalties.append(penalty_type)
         
         if penalties:
             metadata.penalty = ', '.join(penalties)
         
-        # Extract fine amounts
-        fine_pattern = r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
-        fine_matches = re.findall(fine_pattern, text)
-        if fine_matches and 'fine' in penalties:
-            metadata.penalty = f"fine: ${max(fine_matches)}"
+        # Extract fine amounts (only used when a fine penalty was detected)
+        if 'fine' in penalties:
+            fine_matches = _FINE_RE.findall(text)
+            if fine_matches:
+                metadata.penalty = f"fine: ${max(fine_matches)}"
         
         return metadata
 
 
+_metadata_extractor: Optional[MetadataExtractor] = None
+
+
+def get_metadata_extractor() -> MetadataExtractor:
+    """Return the shared extractor instance, creating it on first use."""
+    global _metadata_extractor
+    if _metadata_extractor is None:
+        _metadata_extractor = MetadataExtractor()
+    return _metadata_extractor
+
+
 class MetadataIndex:
-    """Manages metadata index for efficient querying."""
+    """Manages metadata index for efficient querying.
+    
+    Documents are changed only through :meth:`add_document` and
+    :meth:`remove_document`, which drop the search caches. Records handed
+    out by the index are its own; after changing one in place, pass it to
+    :meth:`add_document` again so searches see the change.
+    """
     
     def __init__(self, index_path: Path):
         self.index_path = index_path
         self.metadata_file = index_path / "metadata_index.json"
-        self.index = self._load_index()
+        self._index = self._load_index()
+        # Column store for search(): the documents in index order and, per
+        # searched attribute, each document's value as a string (None when
+        # the attribute is missing). Rebuilt lazily after any change.
+        self._rows: Optional[List[LegalDocumentMetadata]] = None
+        self._columns: Dict[str, List[Optional[str]]] = {}
+        # Sorted (citation, sha256) pairs for prefix lookups, built lazily
+        self._citations: Optional[List[tuple]] = None
+    
+    @property
+    def index(self) -> Mapping[str, LegalDocumentMetadata]:
+        """Read-only view of the documents keyed by sha256."""
+        return MappingProxyType(self._index)
     
     def _load_index(self) -> Dict[str, LegalDocumentMetadata]:
         """Load existing metadata index."""
@@ -232,76 +322,118 @@ class MetadataIndex:
         self.index_path.mkdir(parents=True, exist_ok=True)
         data = {
             sha256: meta.to_dict()
-            for sha256, meta in self.index.items()
+            for sha256, meta in self._index.items()
         }
+        # One-shot compact encoding runs entirely in the C encoder; an
+        # indented json.dump goes through the pure-Python iterencode path
         with open(self.metadata_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            f.write(json.dumps(data))
     
     def add_document(self, metadata: LegalDocumentMetadata):
-        """Add document metadata to index."""
-        self.index[metadata.sha256] = metadata
+        """Add or replace document metadata in the index."""
+        self._index[metadata.sha256] = metadata
+        self._invalidate()
+    
+    def remove_document(self, sha256: str) -> Optional[LegalDocumentMetadata]:
+        """Remove a document from the index, returning its metadata."""
+        metadata = self._index.pop(sha256, None)
+        if metadata is not None:
+            self._invalidate()
+        return metadata
+    
+    def _invalidate(self):
+        """Drop the search caches after the documents change."""
+        self._rows = None
+        self._columns = {}
+        self._citations = None
     
     def get_by_sha256(self, sha256: str) -> Optional[LegalDocumentMetadata]:
         """Get metadata by document hash."""
-        return self.index.get(sha256)
+        return self._index.get(sha256)
+    
+    def _column(self, key: str) -> List[Optional[str]]:
+        """Return ``str(getattr(doc, key))`` for every document, cached."""
+        column = self._columns.get(key)
+        if column is None:
+            if self._rows is None:
+                self._rows = list(self._index.values())
+            column = [
+                str(getattr(metadata, key)) if hasattr(metadata, key) else None
+                for metadata in self._rows
+            ]
+            self._columns[key] = column
+        return column
     
     def search(self, **criteria) -> List[LegalDocumentMetadata]:
-        """Search metadata by criteria."""
-        results = []
+        """Search metadata by criteria.
         
-        for metadata in self.index.values():
-            match = True
-            
-            for key, value in criteria.items():
-                if hasattr(metadata, key):
-                    attr_value = getattr(metadata, key)
-                    if isinstance(value, list):
-                        # Check if any value in list matches
-                        if not any(v in str(attr_value) for v in value):
-                            match = False
-                            break
-                    elif value not in str(attr_value):
-                        match = False
-                        break
-                else:
-                    match = False
-                    break
-            
-            if match:
-                results.append(metadata)
+        Each criterion narrows the candidate rows using that attribute's
+        cached string column, so repeated searches never re-stringify
+        documents.
+        """
+        columns = {key: self._column(key) for key in criteria}
+        rows = self._rows if self._rows is not None else list(self._index.values())
+        candidates = range(len(rows))
+        
+        for key, value in criteria.items():
+            column = columns[key]
+            if isinstance(value, list):
+                # Check if any value in list matches
+                candidates = [
+                    i for i in candidates
+                    if column[i] is not None and any(v in column[i] for v in value)
+                ]
+            else:
+                candidates = [
+                    i for i in candidates
+                    if column[i] is not None and value in column[i]
+                ]
+        
+        results = [rows[i] for i in candidates]
         
         # Sort by authority weight
         results.sort(key=lambda x: x.authority_weight, reverse=True)
         
         return results
     
+    def search_by_citation_prefix(self, prefix: str) -> List[LegalDocumentMetadata]:
+        """Find documents citing a statute, case or regulation by prefix.
+        
+        ``search_by_citation_prefix("A.R.S. § 32-")`` returns every document
+        with a citation starting with that text, best authority first. The
+        citations are kept sorted, so each lookup is a binary search plus
+        the matching range rather than a scan of every document.
+        """
+        if self._citations is None:
+            self._citations = sorted(
+                (citation, sha256)
+                for sha256, metadata in self._index.items()
+                for citation in metadata.all_citations()
+            )
+        
+        citations = self._citations
+        matched = {}
+        i = bisect_left(citations, (prefix,))
+        while i < len(citations) and citations[i][0].startswith(prefix):
+            sha256 = citations[i][1]
+            matched.setdefault(sha256, self._index[sha256])
+            i += 1
+        
+        results = list(matched.values())
+        results.sort(key=lambda x: x.authority_weight, reverse=True)
+        return results
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about the indexed documents."""
-        stats = {
-            'total_documents': len(self.index),
-            'document_types': {},
-            'jurisdictions': {},
-            'violation_types': {},
-            'total_statutes_cited': 0,
-            'total_cases_cited': 0,
-        }
-        
-        for metadata in self.index.values():
-            # Document types
-            doc_type = metadata.document_type
-            stats['document_types'][doc_type] = stats['document_types'].get(doc_type, 0) + 1
-            
-            # Jurisdictions
-            jurisdiction = metadata.jurisdiction
-            stats['jurisdictions'][jurisdiction] = stats['jurisdictions'].get(jurisdiction, 0) + 1
-            
+        documents = self._index.values()
+        return {
+            'total_documents': len(self._index),
+            'document_types': dict(Counter(m.document_type for m in documents)),
+            'jurisdictions': dict(Counter(m.jurisdiction for m in documents)),
             # Violations (ADRE specific)
-            if metadata.violation_type:
-                vtype = metadata.violation_type
-                stats['violation_types'][vtype] = stats['violation_types'].get(vtype, 0) + 1
-            
-            # Citations
-            stats['total_statutes_cited'] += len(metadata.statutes_cited)
-            stats['total_cases_cited'] += len(metadata.cases_cited)
-        
-        return stats
\ No newline at end of file
+            'violation_types': dict(Counter(
+                m.violation_type for m in documents if m.violation_type
+            )),
+            'total_statutes_cited': sum(len(m.statutes_cited) for m in documents),
+            'total_cases_cited': sum(len(m.cases_cited) for m in documents),
+        }
\ No newline at end of file
@@ -2,15 +2,219 @@
 
 from __future__ import annotations
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 
+from dateutil import parser as date_parser
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+def _compile_all(patterns, flags=0) -> List[re.Pattern]:
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+# Enhanced patterns for ADRE cases, compiled once at import with the flags
+# each group is matched with. The patterns run on the raw text, so words
+# are separated by \s+ or \s* rather than a single space, and a name takes
+# a run of whitespace whole (\s+(?!\s)), as one space would be taken in
+# whitespace-collapsed text. _clean_name collapses the runs afterwards.
+_CASE_PATTERNS = {
+    'oah_docket': _compile_all([
+        r'OAH\s+(?:Docket\s+)?(?:No\.?\s*)?([A-Z0-9\-]+)',
+        r'Docket\s+(?:No\.?\s*)?([A-Z0-9\-]+)',
+    ], re.IGNORECASE),
+    'adre_case': _compile_all([
+        r'ADRE\s+(?:Case\s+)?(?:No\.?\s*)?([A-Z0-9\-]+)',
+        r'Case\s+(?:No\.?\s*)?(\d{2}[A-Z]\-[A-Z]\d+(?:\-REL)?(?:\-RHG)?)',
+    ], re.IGNORECASE),
+    'judge': _compile_all([
+        r'ADMINISTRATIVE\s+LAW\s+JUDGE:\s*([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)',
+        r'(?:Judge|ALJ|Hearing\s+Officer):\s*([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)',
+        r'Before(?:\s+the\s+Honorable)?\s+([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+),?\s+(?:Administrative\s+Law\s+Judge|ALJ)',
+        r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)\s*\n\s*Administrative\s+Law\s+Judge',
+    ], re.IGNORECASE | re.MULTILINE),
+    'respondent': _compile_all([
+        r'(?:In\s+the\s+[Mm]atter\s+of|Respondent):\s*([A-Z](?:[A-Za-z,\.]|\s+(?!\s))+?),\s*(?:Respondent|License)',
+        r'([A-Z](?:[A-Za-z,\.]|\s+(?!\s))+?),?\s+Respondent',
+        r'RESPONDENT:\s*([A-Z](?:[A-Za-z,\.]|\s+(?!\s))+?)\Z',
+    ], re.IGNORECASE | re.MULTILINE),
+    'license': _compile_all([
+        r'(?:License|Lic\.?)\s*(?:#|No\.?|Number)?\s*:?\s*([A-Z]{0,2}\d{6,})',
+        r'(?:Real\s+Estate\s+)?(?:Salesperson|Broker)\s+License\s*(?:#|No\.?)?\s*([A-Z]{0,2}\d{6,})',
+    ]),
+    'complainant': _compile_all([
+        r'(?:Complainant|Petitioner):\s*([A-Z](?:[A-Za-z,\.]|\s+(?!\s))+?),',
+        r'([A-Z](?:[A-Za-z,\.]|\s+(?!\s))+?),?\s+(?:Complainant|Petitioner)',
+    ]),
+}
+
+# Violation patterns (matched against lowercased text)
+_VIOLATION_PATTERNS = {
+    'trust_account': _compile_all([
+        r'trust\s+(?:account|funds?)',
+        r'commingl(?:ing|ed?)',
+        r'escrow\s+(?:account|funds?)',
+    ]),
+    'misrepresentation': _compile_all([
+        r'misrepresent(?:ation|ed|ing)?',
+        r'false\s+(?:statement|representation|information)',
+        r'mislead(?:ing)?',
+        r'deceptive\s+(?:practice|conduct)',
+    ]),
+    'disclosure': _compile_all([
+        r'fail(?:ure|ed)?\s+to\s+disclose',
+        r'non(?:-|\s+)?disclosure',
+        r'conceal(?:ment|ed|ing)?',
+    ]),
+    'unlicensed': _compile_all([
+        r'unlicensed\s+(?:activity|practice)',
+        r'practic(?:ing|ed?)\s+without\s+(?:a\s+)?license',
+        r'license\s+required',
+    ]),
+    'negligence': _compile_all([
+        r'negligen(?:ce|t)',
+        r'breach\s+of\s+(?:fiduciary\s+)?duty',
+        r'fail(?:ure|ed)?\s+to\s+exercise\s+reasonable\s+care',
+    ]),
+    'advertising': _compile_all([
+        r'(?:false|misleading)\s+advertising',
+        r'advertising\s+violation',
+    ]),
+    'supervision': _compile_all([
+        r'fail(?:ure|ed)?\s+to\s+supervise',
+        r'inadequate\s+supervision',
+    ]),
+}
+
+# Penalty patterns (matched against lowercased text). Only the penalty type
+# and the fine amount are kept, so optional leading words such as "license
+# is" or "civil" are left out: they never change whether or what a pattern
+# captures, and a pattern starting with a literal is scanned far faster.
+_PENALTY_PATTERNS = {
+    'revocation': re.compile(r'revok(?:ed?|ation)'),
+    'suspension': re.compile(r'suspend(?:ed?|suspension)'),
+    'probation': re.compile(r'probation(?:ary)?'),
+    'censure': re.compile(r'censure[d]?'),
+    'fine': re.compile(r'(?:penalty|fine)\s+of\s+\$?([\d,]+)'),
+    'education': re.compile(r'(?:complete|take)\s+(?:\d+\s+hours?\s+of\s+)?(?:continuing\s+)?education'),
+    'cease_desist': re.compile(r'cease\s+and\s+desist'),
+}
+
+_LICENSE_FORMAT_RE = re.compile(r'^[A-Z]{0,2}\d{6,}$')
+
+# Statute violations: A.R.S. and A.A.C. citations in one pass. A leading
+# "violation of" never changed which citation matched or what it captured,
+# and leaving it out lets the scan jump straight to each "A."
+_STATUTE_RE = re.compile(
+    r'A\.(?:R\.S\.?\s*§?\s*(?P<ars>[\d\-\.]+)|A\.C\.?\s*R?(?P<aac>[\d\-]+))',
+    re.IGNORECASE,
+)
+
+# Dates, each with the context it is evidence for and, where there is one,
+# a literal every match contains (the pass is skipped when it is absent)
+_DATE_PATTERNS = [
+    (re.compile(r'(?:hearing|heard)\s+on\s+(\w+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE), 'hearing', None),
+    (re.compile(r'(?:dated?|issued?)\s+(?:this\s+)?(\w+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE), 'decision', None),
+    (re.compile(r'(\d{1,2}/\d{1,2}/\d{4})', re.IGNORECASE), 'general', '/'),
+]
+
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse a matched date, building M/D/YYYY dates without dateutil."""
+    if '/' in date_str:
+        month, day, year = date_str.split('/')
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            pass  # e.g. day first; let dateutil decide
+    return date_parser.parse(date_str)
+
+
+# Document type indicators, in precedence order
+_DOC_TYPE_INDICATORS = {
+    'findings_of_fact': ['FINDINGS OF FACT', 'FINDINGS AND CONCLUSIONS', 'FINDINGS'],
+    'order': ['ORDER', 'FINAL ORDER', "COMMISSIONER'S FINAL ORDER", 'ADMINISTRATIVE ORDER'],
+    'notice_of_hearing': ['NOTICE OF HEARING', 'HEARING NOTICE'],
+    'motion': ['MOTION FOR', 'MOTION TO'],
+    'complaint': ['COMPLAINT', 'PETITION'],
+    'settlement': ['CONSENT ORDER', 'SETTLEMENT AGREEMENT'],
+    'decision': ['DECISION AND ORDER', 'FINAL DECISION'],
+}
+
+# Additional heuristics, tried after every indicator
+_DOC_TYPE_HEURISTICS = (
+    ('order', 'HEREBY ORDERED'),
+    ('notice_of_hearing', 'HEARING WILL BE HELD'),
+    ('complaint', 'COMPLAINT ALLEGES'),
+)
+
+
+def _doc_type_scan():
+    """Build the (doc type, indicators) list _classify_document_type scans.
+    
+    An indicator containing another one from the same or an earlier entry
+    can never decide the type (wherever it occurs, the shorter one does
+    too), so it is left out, saving a substring scan of the text. That
+    covers "FINAL ORDER" and "CONSENT ORDER" as well as "HEREBY ORDERED".
+    """
+    entries = list(_DOC_TYPE_INDICATORS.items())
+    entries += [(doc_type, [indicator]) for doc_type, indicator in _DOC_TYPE_HEURISTICS]
+    scan = []
+    earlier: List[str] = []
+    for doc_type, indicators in entries:
+        candidates = earlier + indicators
+        kept = tuple(
+            indicator for indicator in indicators
+            if not any(other != indicator and other in indicator for other in candidates)
+        )
+        if kept:
+            scan.append((doc_type, kept))
+        earlier += indicators
+    return tuple(scan)
+
+
+_DOC_TYPE_SCAN = _doc_type_scan()
+
+# Extracted names that are really document terms, lowercased once
+_INVALID_JUDGE_NAMES = frozenset(term.lower() for term in (
+    'Copy', 'Order', 'Decision', 'Arizona', 'Department',
+    'Transmitted', 'Page', 'of', 'the', 'and',
+))
+_INVALID_PERSON_TERMS = tuple(term.lower() for term in (
+    'Respondent', 'Petitioner', 'Complainant', 'License',
+    'Matter', 'Case', 'Docket', 'State', 'Arizona',
+))
+
+# Stripped from the end of extracted names
+_NAME_TRAILING_PUNCTUATION = '.,;:'
+
+
+# Findings and conclusions. These and the order patterns end with a
+# period, so no match extends past the text's last one; matching up to it
+# (endpos) gives the same matches without trying every start in the tail,
+# where each failed attempt scans to the end of the text or line: O(n^2)
+# on a long period-free tail full of "ORDER"s or "THEREFORE"s.
+_FINDING_RE = re.compile(r'(?:FINDING|FACT)\s*(?:OF\s+FACT\s*)?#?\s*(\d+)[:\.]?\s*([^.\n]+(?:\.[^.\n]+)*\.)', re.IGNORECASE)
+_CONCLUSION_RE = re.compile(r'(?:THEREFORE|CONCLUDES?|FINDS?)\s+(?:THAT\s+)?([^.\n]+\.)', re.IGNORECASE)
+# Limit to the 10 most important findings
+_MAX_FINDINGS = 10
+
+# Order text, in order of preference
+_ORDER_PATTERNS = _compile_all([
+    r'IT\s+IS\s+(?:HEREBY\s+)?ORDERED\s+(?:THAT\s+)?([^.]+(?:\.[^.]+)*\.)',
+    r'ORDERS?\s*:\s*\n([^.]+(?:\.[^.]+)*\.)',
+    r'(?:HEREBY\s+)?ORDERS?\s+(?:AS\s+FOLLOWS\s*:?\s*)?([^.]+(?:\.[^.]+)*\.)',
+], re.IGNORECASE | re.MULTILINE)
+
+# ADRE case numbers in filenames
+_FILENAME_CASE_RE = re.compile(r'(\d{2}[A-Z]\-[A-Z]\d+(?:\-REL)?(?:\-RHG)?)')
+
+@dataclass(slots=True)
 class ADRECaseInfo:
     """Structured information from ADRE/OAH cases."""
     case_number: str
@@ -33,129 +237,40 @@ class ADRECaseInfo:
 class EnhancedLegalProcessor:
     """Enhanced processor specifically for ADRE/OAH documents."""
     
-    def __init__(self):
-        # Enhanced patterns for ADRE cases
-        self.case_patterns = {
-            'oah_docket': [
-                r'OAH\s+(?:Docket\s+)?(?:No\.?\s*)?([A-Z0-9\-]+)',
-                r'Docket\s+(?:No\.?\s*)?([A-Z0-9\-]+)',
-            ],
-            'adre_case': [
-                r'ADRE\s+(?:Case\s+)?(?:No\.?\s*)?([A-Z0-9\-]+)',
-                r'Case\s+(?:No\.?\s*)?(\d{2}[A-Z]\-[A-Z]\d+(?:\-REL)?(?:\-RHG)?)',
-            ],
-            'judge': [
-                r'ADMINISTRATIVE\s+LAW\s+JUDGE:\s*([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)',
-                r'(?:Judge|ALJ|Hearing\s+Officer):\s*([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)',
-                r'Before(?:\s+the\s+Honorable)?\s+([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+),?\s+(?:Administrative\s+Law\s+Judge|ALJ)',
-                r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)+)\s*\n\s*Administrative\s+Law\s+Judge',
-            ],
-            'respondent': [
-                r'(?:In\s+the\s+[Mm]atter\s+of|Respondent):\s*([A-Z][A-Za-z\s,\.]+?)(?:\n|,\s*(?:Respondent|License))',
-                r'([A-Z][A-Za-z\s,\.]+?),?\s+Respondent',
-                r'RESPONDENT:\s*([A-Z][A-Za-z\s,\.]+?)(?:\n|$)',
-            ],
-            'license': [
-                r'(?:License|Lic\.?)\s*(?:#|No\.?|Number)?\s*:?\s*([A-Z]{0,2}\d{6,})',
-                r'(?:Real\s+Estate\s+)?(?:Salesperson|Broker)\s+License\s*(?:#|No\.?)?\s*([A-Z]{0,2}\d{6,})',
-            ],
-            'complainant': [
-                r'(?:Complainant|Petitioner):\s*([A-Z][A-Za-z\s,\.]+?)(?:\n|,)',
-                r'([A-Z][A-Za-z\s,\.]+?),?\s+(?:Complainant|Petitioner)',
-            ]
-        }
-        
-        # Document type indicators
-        self.doc_type_indicators = {
-            'findings_of_fact': ['FINDINGS OF FACT', 'FINDINGS AND CONCLUSIONS', 'FINDINGS'],
-            'order': ['ORDER', 'FINAL ORDER', "COMMISSIONER'S FINAL ORDER", 'ADMINISTRATIVE ORDER'],
-            'notice_of_hearing': ['NOTICE OF HEARING', 'HEARING NOTICE'],
-            'motion': ['MOTION FOR', 'MOTION TO'],
-            'complaint': ['COMPLAINT', 'PETITION'],
-            'settlement': ['CONSENT ORDER', 'SETTLEMENT AGREEMENT'],
-            'decision': ['DECISION AND ORDER', 'FINAL DECISION'],
-        }
-        
-        # Violation patterns
-        self.violation_patterns = {
-            'trust_account': [
-                r'trust\s+(?:account|funds?)',
-                r'commingl(?:ing|ed?)',
-                r'escrow\s+(?:account|funds?)',
-            ],
-            'misrepresentation': [
-                r'misrepresent(?:ation|ed|ing)?',
-                r'false\s+(?:statement|representation|information)',
-                r'mislead(?:ing)?',
-                r'deceptive\s+(?:practice|conduct)',
-            ],
-            'disclosure': [
-                r'fail(?:ure|ed)?\s+to\s+disclose',
-                r'non[\-\s]?disclosure',
-                r'conceal(?:ment|ed|ing)?',
-            ],
-            'unlicensed': [
-                r'unlicensed\s+(?:activity|practice)',
-                r'practic(?:ing|ed?)\s+without\s+(?:a\s+)?license',
-                r'license\s+required',
-            ],
-            'negligence': [
-                r'negligen(?:ce|t)',
-                r'breach\s+of\s+(?:fiduciary\s+)?duty',
-                r'fail(?:ure|ed)?\s+to\s+exercise\s+reasonable\s+care',
-            ],
-            'advertising': [
-                r'(?:false|misleading)\s+advertising',
-                r'advertising\s+violation',
-            ],
-            'supervision': [
-                r'fail(?:ure|ed)?\s+to\s+supervise',
-                r'inadequate\s+supervision',
-            ]
-        }
-        
-        # Penalty patterns
-        self.penalty_patterns = {
-            'revocation': r'(?:license\s+)?(?:is\s+)?revok(?:ed?|ation)',
-            'suspension': r'(?:license\s+)?(?:is\s+)?suspend(?:ed?|suspension)',
-            'probation': r'probation(?:ary)?',
-            'censure': r'censure[d]?',
-            'fine': r'(?:civil\s+)?(?:penalty|fine)\s+of\s+\$?([\d,]+)',
-            'education': r'(?:complete|take)\s+(?:\d+\s+hours?\s+of\s+)?(?:continuing\s+)?education',
-            'cease_desist': r'cease\s+and\s+desist',
-        }
+    # Compiled once at import and shared by every instance, so
+    # constructing a processor costs nothing
+    case_patterns = _CASE_PATTERNS
+    violation_patterns = _VIOLATION_PATTERNS
+    penalty_patterns = _PENALTY_PATTERNS
+    doc_type_indicators = _DOC_TYPE_INDICATORS
     
     def extract_case_info(self, text: str, filename: str = "") -> ADRECaseInfo:
         """Extract comprehensive case information from ADRE/OAH document."""
         info = ADRECaseInfo(case_number=self._extract_case_number_from_filename(filename))
         
-        # Clean text for better matching
-        text_clean = re.sub(r'\s+', ' ', text)
-        text_lines = text.split('\n')
-        
         # Extract case numbers
         for pattern in self.case_patterns['oah_docket']:
-            match = re.search(pattern, text_clean, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 info.oah_docket = match.group(1)
                 break
         
         for pattern in self.case_patterns['adre_case']:
-            match = re.search(pattern, text_clean, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 info.adre_case_no = match.group(1)
                 break
         
         # Extract judge name (enhanced logic)
-        info.judge_name = self._extract_judge_name(text, text_lines)
+        info.judge_name = self._extract_judge_name(text)
         
         # Extract respondent and license
-        info.respondent_name = self._extract_respondent_name(text_clean)
-        info.respondent_license = self._extract_license_number(text_clean)
+        info.respondent_name = self._extract_respondent_name(text)
+        info.respondent_license = self._extract_license_number(text)
         
         # Extract complainant
         for pattern in self.case_patterns['complainant']:
-            match = re.search(pattern, text_clean)
+            match = pattern.search(text)
             if match:
                 info.complainant = self._clean_name(match.group(1))
                 break
@@ -163,12 +278,13 @@ class EnhancedLegalProcessor:
         # Determine document type
         info.document_type = self._classify_document_type(text)
         
-        # Extract violations
-        info.violations = self._extract_violations(text_clean)
-        info.statutes_violated = self._extract_statute_violations(text_clean)
-        
-        # Extract penalties
-        info.penalties = self._extract_penalties(text_clean)
+        # Extract violations and penalties; their patterns are written in
+        # lower case and share one lowered copy of the text (an IGNORECASE
+        # search is several times slower in sre than lowering once)
+        text_lower = text.lower()
+        info.violations = self._extract_violations(text_lower)
+        info.statutes_violated = self._extract_statute_violations(text)
+        info.penalties = self._extract_penalties(text_lower)
         
         # Extract dates
         dates = self._extract_dates_with_context(text)
@@ -181,18 +297,39 @@ class EnhancedLegalProcessor:
         
         return info
     
-    def _extract_judge_name(self, text: str, text_lines: List[str]) -> Optional[str]:
+    def extract_case_info_batch(self, items: List[Tuple[str, str]],
+                                max_workers: Optional[int] = None) -> List[ADRECaseInfo]:
+        """Extract case information for many (text, filename) pairs.
+        
+        Documents are independent and the work is CPU-bound regex
+        matching, so they are spread over worker processes; results come
+        back in input order.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                self.extract_case_info,
+                [text for text, _ in items],
+                [filename for _, filename in items],
+                chunksize=16,
+            ))
+    
+    def _extract_judge_name(self, text: str) -> Optional[str]:
         """Enhanced judge name extraction."""
         # Try each pattern
         for pattern in self.case_patterns['judge']:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            match = pattern.search(text)
             if match:
                 name = self._clean_name(match.group(1))
                 # Validate it's a real name
                 if self._is_valid_judge_name(name):
                     return name
         
-        # Look for specific format in lines
+        # Look for specific format in lines. upper() works per character, so
+        # no line can contain the heading unless the whole text does, and
+        # one check spares splitting the text and uppercasing every line.
+        if 'ADMINISTRATIVE LAW JUDGE' not in text.upper():
+            return None
+        text_lines = text.split('\n')
         for i, line in enumerate(text_lines):
             if 'ADMINISTRATIVE LAW JUDGE' in line.upper():
                 # Check same line after colon
@@ -219,11 +356,8 @@ class EnhancedLegalProcessor:
             return False
         
         # Filter out common false positives
-        invalid_terms = ['Copy', 'Order', 'Decision', 'Arizona', 'Department', 
-                        'Transmitted', 'Page', 'of', 'the', 'and']
-        for term in invalid_terms:
-            if term.lower() == name.lower():
-                return False
+        if name.lower() in _INVALID_JUDGE_NAMES:
+            return False
         
         # Should start with capital letter
         if not name[0].isupper():
@@ -234,7 +368,7 @@ class EnhancedLegalProcessor:
     def _extract_respondent_name(self, text: str) -> Optional[str]:
         """Extract respondent name with validation."""
         for pattern in self.case_patterns['respondent']:
-            matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
+            matches = pattern.finditer(text)
             for match in matches:
                 name = self._clean_name(match.group(1))
                 if self._is_valid_person_name(name):
@@ -247,11 +381,9 @@ class EnhancedLegalProcessor:
             return False
         
         # Filter out common document terms
-        invalid_terms = ['Respondent', 'Petitioner', 'Complainant', 'License', 
-                        'Matter', 'Case', 'Docket', 'State', 'Arizona']
-        
-        for term in invalid_terms:
-            if term.lower() in name.lower():
+        name_lower = name.lower()
+        for term in _INVALID_PERSON_TERMS:
+            if term in name_lower:
                 return False
         
         return True
@@ -259,11 +391,11 @@ class EnhancedLegalProcessor:
     def _extract_license_number(self, text: str) -> Optional[str]:
         """Extract license number with validation."""
         for pattern in self.case_patterns['license']:
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
                 license_no = match.group(1)
                 # Validate format (should be alphanumeric, 6+ chars)
-                if re.match(r'^[A-Z]{0,2}\d{6,}$', license_no):
+                if _LICENSE_FORMAT_RE.match(license_no):
                     return license_no
         return None
     
@@ -271,84 +403,65 @@ class EnhancedLegalProcessor:
         """Classify document type based on content."""
         text_upper = text.upper()
         
-        for doc_type, indicators in self.doc_type_indicators.items():
+        for doc_type, indicators in _DOC_TYPE_SCAN:
             for indicator in indicators:
                 if indicator in text_upper:
                     return doc_type
         
-        # Additional heuristics
-        if 'HEREBY ORDERED' in text_upper:
-            return 'order'
-        elif 'HEARING WILL BE HELD' in text_upper:
-            return 'notice_of_hearing'
-        elif 'COMPLAINT ALLEGES' in text_upper:
-            return 'complaint'
-        
         return 'unknown'
     
-    def _extract_violations(self, text: str) -> List[str]:
-        """Extract violation types from text."""
+    def _extract_violations(self, text_lower: str) -> List[str]:
+        """Extract violation types from already lowercased text."""
         violations = []
-        text_lower = text.lower()
         
         for violation_type, patterns in self.violation_patterns.items():
             for pattern in patterns:
-                if re.search(pattern, text_lower):
+                if pattern.search(text_lower):
                     violations.append(violation_type)
                     break
         
-        return list(set(violations))
+        # Each type is added at most once, in table order
+        return violations
     
     def _extract_statute_violations(self, text: str) -> List[str]:
         """Extract specific statute violations."""
-        statutes = []
-        
-        # A.R.S. patterns
-        ars_pattern = r'(?:violat(?:ed?|ion)\s+of\s+)?A\.R\.S\.?\s*§?\s*([\d\-\.]+)'
-        for match in re.finditer(ars_pattern, text, re.IGNORECASE):
-            statutes.append(f"A.R.S. § {match.group(1)}")
+        ars, aac = [], []
         
-        # A.A.C. patterns
-        aac_pattern = r'(?:violat(?:ed?|ion)\s+of\s+)?A\.A\.C\.?\s*R?([\d\-]+)'
-        for match in re.finditer(aac_pattern, text, re.IGNORECASE):
-            statutes.append(f"A.A.C. R{match.group(1)}")
+        for match in _STATUTE_RE.finditer(text):
+            if match.lastgroup == 'ars':
+                ars.append(f"A.R.S. § {match.group('ars')}")
+            else:
+                aac.append(f"A.A.C. R{match.group('aac')}")
         
-        return list(set(statutes))
+        # A.R.S. citations first, then A.A.C.; drop repeats, keeping the
+        # order of first citation
+        return list(dict.fromkeys(ars + aac))
     
-    def _extract_penalties(self, text: str) -> List[str]:
-        """Extract penalties imposed."""
+    def _extract_penalties(self, text_lower: str) -> List[str]:
+        """Extract penalties imposed from already lowercased text."""
         penalties = []
-        text_lower = text.lower()
         
         for penalty_type, pattern in self.penalty_patterns.items():
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                if penalty_type == 'fine' and len(match.groups()) > 0:
-                    amount = match.group(1)
-                    penalties.append(f"Fine: ${amount}")
-                else:
-                    penalties.append(penalty_type.replace('_', ' ').title())
-        
-        return list(set(penalties))
+            if penalty_type == 'fine':
+                for match in pattern.finditer(text_lower):
+                    penalties.append(f"Fine: ${match.group(1)}")
+            elif pattern.search(text_lower):
+                penalties.append(penalty_type.replace('_', ' ').title())
+        
+        # Drop repeated fine amounts, keeping table order
+        return list(dict.fromkeys(penalties))
     
     def _extract_dates_with_context(self, text: str) -> Dict[str, datetime]:
         """Extract dates with their context."""
         dates = {}
         
-        # Date patterns
-        date_patterns = [
-            (r'(?:hearing|heard)\s+on\s+(\w+\s+\d{1,2},?\s+\d{4})', 'hearing'),
-            (r'(?:dated?|issued?)\s+(?:this\s+)?(\w+\s+\d{1,2},?\s+\d{4})', 'decision'),
-            (r'(\d{1,2}/\d{1,2}/\d{4})', 'general'),
-        ]
-        
-        from dateutil import parser as date_parser
-        
-        for pattern, context in date_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern, context, literal in _DATE_PATTERNS:
+            if literal and literal not in text:
+                continue
+            for match in pattern.finditer(text):
                 try:
                     date_str = match.group(1)
-                    parsed_date = date_parser.parse(date_str)
+                    parsed_date = _parse_date(date_str)
                     if context == 'general':
                         # Try to determine context from surrounding text
                         surrounding = text[max(0, match.start()-50):match.end()+50].lower()
@@ -366,33 +479,32 @@ class EnhancedLegalProcessor:
     def _extract_findings(self, text: str) -> List[str]:
         """Extract key findings from the document."""
         findings = []
+        end = text.rfind('.') + 1
         
-        # Look for numbered findings
-        finding_pattern = r'(?:FINDING|FACT)\s*(?:OF\s+FACT\s*)?#?\s*(\d+)[:\.]?\s*([^.\n]+(?:\.[^.\n]+)*\.)'
-        for match in re.finditer(finding_pattern, text, re.IGNORECASE):
+        # Look for numbered findings. Only the first _MAX_FINDINGS are
+        # kept, and finditer is lazy, so stop scanning once they are found.
+        for match in _FINDING_RE.finditer(text, 0, end):
             finding_text = match.group(2).strip()
             if len(finding_text) > 20:  # Filter out very short findings
                 findings.append(f"Finding {match.group(1)}: {finding_text[:200]}")
+                if len(findings) == _MAX_FINDINGS:
+                    return findings
         
         # Look for conclusions
-        conclusion_pattern = r'(?:THEREFORE|CONCLUDES?|FINDS?)\s+(?:THAT\s+)?([^.\n]+\.)'
-        for match in re.finditer(conclusion_pattern, text, re.IGNORECASE):
+        for match in _CONCLUSION_RE.finditer(text, 0, end):
             conclusion = match.group(1).strip()
             if len(conclusion) > 20 and conclusion not in findings:
                 findings.append(f"Conclusion: {conclusion[:200]}")
+                if len(findings) == _MAX_FINDINGS:
+                    break
         
-        return findings[:10]  # Limit to 10 most important findings
+        return findings
     
     def _extract_order_text(self, text: str) -> Optional[str]:
         """Extract the main order text."""
-        order_patterns = [
-            r'IT\s+IS\s+(?:HEREBY\s+)?ORDERED\s+(?:THAT\s+)?([^.]+(?:\.[^.]+)*\.)',
-            r'ORDERS?\s*:\s*\n([^.]+(?:\.[^.]+)*\.)',
-            r'(?:HEREBY\s+)?ORDERS?\s+(?:AS\s+FOLLOWS\s*:?\s*)?([^.]+(?:\.[^.]+)*\.)',
-        ]
-        
-        for pattern in order_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        end = text.rfind('.') + 1
+        for pattern in _ORDER_PATTERNS:
+            match = pattern.search(text, 0, end)
             if match:
                 order_text = match.group(1).strip()
                 if len(order_text) > 30:  # Ensure it's substantial
@@ -403,7 +515,7 @@ class EnhancedLegalProcessor:
     def _extract_case_number_from_filename(self, filename: str) -> str:
         """Extract case number from filename."""
         # Pattern for ADRE case numbers in filenames
-        match = re.search(r'(\d{2}[A-Z]\-[A-Z]\d+(?:\-REL)?(?:\-RHG)?)', filename)
+        match = _FILENAME_CASE_RE.search(filename)
         if match:
             return match.group(1)
         return filename
@@ -413,12 +525,26 @@ class EnhancedLegalProcessor:
         # Remove extra whitespace
         name = ' '.join(name.split())
         # Remove trailing punctuation
-        name = name.rstrip('.,;:')
-        # Title case
-        return name.title()
+        name = name.rstrip(_NAME_TRAILING_PUNCTUATION)
+        # Title case single-case names and names starting in lower case
+        # (the IGNORECASE patterns capture "velva Moses"); other mixed case
+        # is already as written, and title() would turn "McDonald" into
+        # "Mcdonald"
+        if name.isupper() or name.islower() or name[:1].islower():
+            return name.title()
+        return name
     
     def create_enhanced_chunks(self, text: str, case_info: ADRECaseInfo) -> List[Dict]:
-        """Create chunks with enhanced metadata."""
+        """Create chunks with enhanced metadata.
+        
+        Returns no chunks when nothing was extracted (e.g. a scanned cover
+        sheet), as the lone case header would only repeat the case number.
+        """
+        if not (case_info.order_text or case_info.violations or case_info.penalties
+                or case_info.findings or case_info.oah_docket or case_info.respondent_name
+                or case_info.respondent_license or case_info.judge_name):
+            return []
+        
         chunks = []
         
         # Priority 1: Order text
@@ -436,9 +562,12 @@ class EnhancedLegalProcessor:
         
         # Priority 2: Violations and penalties
         if case_info.violations or case_info.penalties:
-            violation_text = f"Case {case_info.case_number} - Violations: {', '.join(case_info.violations)}. "
-            violation_text += f"Statutes violated: {', '.join(case_info.statutes_violated)}. "
-            violation_text += f"Penalties: {', '.join(case_info.penalties)}"
+            # Adjacent f-strings are built as one string
+            violation_text = (
+                f"Case {case_info.case_number} - Violations: {', '.join(case_info.violations)}. "
+                f"Statutes violated: {', '.join(case_info.statutes_violated)}. "
+                f"Penalties: {', '.join(case_info.penalties)}"
+            )
             
             chunks.append({
                 'content': violation_text,
@@ -451,15 +580,16 @@ class EnhancedLegalProcessor:
             })
         
         # Priority 3: Case header information
-        header_text = f"ADRE Case {case_info.case_number}"
+        header_parts = [f"ADRE Case {case_info.case_number}"]
         if case_info.oah_docket:
-            header_text += f", OAH Docket {case_info.oah_docket}"
+            header_parts.append(f", OAH Docket {case_info.oah_docket}")
         if case_info.respondent_name:
-            header_text += f". Respondent: {case_info.respondent_name}"
+            header_parts.append(f". Respondent: {case_info.respondent_name}")
         if case_info.respondent_license:
-            header_text += f" (License: {case_info.respondent_license})"
+            header_parts.append(f" (License: {case_info.respondent_license})")
         if case_info.judge_name:
-            header_text += f". Judge: {case_info.judge_name}"
+            header_parts.append(f". Judge: {case_info.judge_name}")
+        header_text = "".join(header_parts)
         
         chunks.append({
             'content': header_text,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
@@ -10,14 +11,70 @@ from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate
 from langchain.callbacks.base import BaseCallbackHandler
 
-from .legal_processor import LegalDocumentProcessor, LegalEntity
+from .legal_processor import LegalEntity, get_legal_processor
+
+
+def _compile_all(patterns) -> List[re.Pattern]:
+    return [re.compile(pattern) for pattern in patterns]
+
+
+# Common legal query patterns, matched against the lowercased query
+_QUERY_PATTERNS = {
+    'statute_lookup': _compile_all([
+        r'what\s+(?:does|is)\s+(?:ars|statute|section)\s*§?\s*(\d+[-–]\d+)',
+        r'explain\s+(?:ars|statute|section)\s*§?\s*(\d+[-–]\d+)',
+        r'(?:ars|statute|section)\s*§?\s*(\d+[-–]\d+)\s+(?:says?|provides?|states?)',
+    ]),
+    'case_lookup': _compile_all([
+        r'what\s+(?:did|was|happened)\s+in\s+([A-Za-z\s]+v\.\s+[A-Za-z\s]+)',
+        r'([A-Za-z\s]+v\.\s+[A-Za-z\s]+)\s+(?:held|decided|ruling)',
+    ]),
+    'compliance': _compile_all([
+        r'(?:do|does|did)\s+(?:i|we|they)\s+(?:comply|violate|breach)',
+        r'(?:is|was)\s+(?:this|that|it)\s+(?:legal|allowed|permitted|compliant)',
+    ]),
+    'precedent': _compile_all([
+        r'(?:cases?|precedents?|rulings?)\s+(?:about|regarding|on)\s+(.+)',
+        r'(?:similar|related)\s+(?:cases?|rulings?)',
+    ]),
+    'deadline': _compile_all([
+        r'(?:when|deadline|time\s+limit|statute\s+of\s+limitations?)\s+(?:for|to)\s+(.+)',
+        r'how\s+(?:long|many\s+days?)\s+(?:do|does)\s+(?:i|we)\s+have',
+    ])
+}
+
+# A literal every pattern of a query type needs; the type is skipped when
+# the query lacks it (the case name patterns backtrack over the whole query)
+_QUERY_LITERALS = {
+    'case_lookup': 'v.',
+}
+
+# Related legal concepts added when a query mentions the key term
+_CONCEPT_RELATIONS = {
+    'breach': ['violation', 'non-compliance', 'failure to comply'],
+    'negligence': ['duty of care', 'reasonable care', 'breach of duty'],
+    'damages': ['compensation', 'remedies', 'relief'],
+    'motion': ['request', 'petition', 'application'],
+    'discovery': ['disclosure', 'interrogatories', 'depositions'],
+    'summary judgment': ['rule 56', 'no genuine issue', 'material fact'],
+}
+
+# Words that give a query a temporal context, in order of precedence
+_TEMPORAL_KEYWORDS = {
+    'current': 'present',
+    'latest': 'most_recent',
+    'historical': 'past',
+    'before': 'prior_to',
+    'after': 'subsequent_to',
+    'between': 'date_range',
+}
 
 
 class LegalQueryEnhancer:
     """Enhances queries with legal context and understanding."""
     
     def __init__(self):
-        self.processor = LegalDocumentProcessor()
+        self.processor = get_legal_processor()
         self.legal_abbreviations = {
             'ars': 'Arizona Revised Statutes',
             'aac': 'Arizona Administrative Code',
@@ -28,30 +85,8 @@ class LegalQueryEnhancer:
             'azrcp': 'Arizona Rules of Civil Procedure',
         }
         
-        # Common legal query patterns
-        self.query_patterns = {
-            'statute_lookup': [
-                r'what\s+(?:does|is)\s+(?:ars|statute|section)\s*§?\s*(\d+[-–]\d+)',
-                r'explain\s+(?:ars|statute|section)\s*§?\s*(\d+[-–]\d+)',
-                r'(?:ars|statute|section)\s*§?\s*(\d+[-–]\d+)\s+(?:says?|provides?|states?)',
-            ],
-            'case_lookup': [
-                r'what\s+(?:did|was|happened)\s+in\s+([A-Za-z\s]+v\.\s+[A-Za-z\s]+)',
-                r'([A-Za-z\s]+v\.\s+[A-Za-z\s]+)\s+(?:held|decided|ruling)',
-            ],
-            'compliance': [
-                r'(?:do|does|did)\s+(?:i|we|they)\s+(?:comply|violate|breach)',
-                r'(?:is|was)\s+(?:this|that|it)\s+(?:legal|allowed|permitted|compliant)',
-            ],
-            'precedent': [
-                r'(?:cases?|precedents?|rulings?)\s+(?:about|regarding|on)\s+(.+)',
-                r'(?:similar|related)\s+(?:cases?|rulings?)',
-            ],
-            'deadline': [
-                r'(?:when|deadline|time\s+limit|statute\s+of\s+limitations?)\s+(?:for|to)\s+(.+)',
-                r'how\s+(?:long|many\s+days?)\s+(?:do|does)\s+(?:i|we)\s+have',
-            ]
-        }
+        # Compiled once at import; shared by every instance
+        self.query_patterns = _QUERY_PATTERNS
     
     def enhance_query(self, query: str) -> Dict[str, any]:
         """Enhance query with legal understanding."""
@@ -82,8 +117,11 @@ class LegalQueryEnhancer:
         query_lower = query.lower()
         
         for query_type, patterns in self.query_patterns.items():
+            literal = _QUERY_LITERALS.get(query_type)
+            if literal and literal not in query_lower:
+                continue
             for pattern in patterns:
-                if re.search(pattern, query_lower):
+                if pattern.search(query_lower):
                     return query_type
         
         # Additional classification based on keywords
@@ -111,16 +149,7 @@ class LegalQueryEnhancer:
                 expanded_terms.append(full)
         
         # Add related legal concepts
-        concept_relations = {
-            'breach': ['violation', 'non-compliance', 'failure to comply'],
-            'negligence': ['duty of care', 'reasonable care', 'breach of duty'],
-            'damages': ['compensation', 'remedies', 'relief'],
-            'motion': ['request', 'petition', 'application'],
-            'discovery': ['disclosure', 'interrogatories', 'depositions'],
-            'summary judgment': ['rule 56', 'no genuine issue', 'material fact'],
-        }
-        
-        for concept, related in concept_relations.items():
+        for concept, related in _CONCEPT_RELATIONS.items():
             if concept in query_lower:
                 expanded_terms.extend(related)
         
@@ -128,17 +157,9 @@ class LegalQueryEnhancer:
     
     def _extract_temporal_context(self, query: str) -> Optional[Dict]:
         """Extract temporal context from query."""
-        temporal_keywords = {
-            'current': 'present',
-            'latest': 'most_recent',
-            'historical': 'past',
-            'before': 'prior_to',
-            'after': 'subsequent_to',
-            'between': 'date_range',
-        }
-        
-        for keyword, context_type in temporal_keywords.items():
-            if keyword in query.lower():
+        query_lower = query.lower()
+        for keyword, context_type in _TEMPORAL_KEYWORDS.items():
+            if keyword in query_lower:
                 return {'type': context_type, 'keyword': keyword}
         
         # Check for specific dates
@@ -236,7 +257,7 @@ class LegalCallbackHandler(BaseCallbackHandler):
     def on_llm_end(self, response, **kwargs):
         """Process LLM response for citations."""
         text = str(response)
-        processor = LegalDocumentProcessor()
+        processor = get_legal_processor()
         citations = processor.extract_citations(text)
         
         for citation_type, citation_list in citations.items():
@@ -247,8 +268,14 @@ class LegalCallbackHandler(BaseCallbackHandler):
             print(f"📚 Found {len(self.citations_found)} legal citations")
 
 
+@lru_cache(maxsize=16)
 def create_legal_prompt_template(query_type: str) -> ChatPromptTemplate:
-    """Create a prompt template for legal queries."""
+    """Create a prompt template for legal queries.
+    
+    Templates depend only on the query type, of which there are a
+    handful, so each is built once and shared (templates are not
+    modified when chains use them).
+    """
     system_prompt = LegalSystemPrompt.get_system_prompt(query_type)
     
     messages = [
@@ -1,13 +1,18 @@
 """Enhanced FastAPI server with legal-specific endpoints."""
 
 from fastapi import FastAPI, Query, HTTPException
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from langchain_chroma import Chroma
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 from langchain.chains import create_retrieval_chain
@@ -15,17 +20,22 @@ from langchain.chains.combine_documents import create_stuff_documents_chain
 
 from .config import INDEX_DIR, CHAT_MODEL, EMBED_MODEL
 from .query import build_legal_aware_retriever
-from .hybrid_retriever_simple import create_hybrid_retrieval_chain
+from .hybrid_retriever import clear_collection_cache
+from .hybrid_retriever_simple import create_hybrid_retrieval_chain, clear_db_cache
 from .legal_query import LegalQueryEnhancer, create_legal_prompt_template
 from .legal_metadata import MetadataIndex
 from .citation_resolver import CitationResolver, CitationEnhancer
-from .legal_processor import LegalDocumentProcessor
+from .legal_processor import get_legal_processor
+
 
+# Serialize responses with orjson when it is installed
+_ResponseClass = ORJSONResponse if orjson is not None else JSONResponse
 
 app = FastAPI(
     title="Legal RAG Assistant",
     description="AI-powered legal research assistant for ADRE/OAH cases",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=_ResponseClass,
 )
 
 # Mount static files
@@ -56,6 +66,48 @@ async def read_root():
         }
 
 
+# Long-lived helpers shared by every request, created on first use. The
+# resolver keeps per-project metadata and its citation cache between
+# requests, and each project's metadata index keeps its search columns;
+# /admin/reload drops both after the indexes are rebuilt.
+_query_enhancer: Optional[LegalQueryEnhancer] = None
+_llm: Optional[ChatOpenAI] = None
+_citation_resolver: Optional[CitationResolver] = None
+_metadata_indexes: Dict[str, MetadataIndex] = {}
+
+
+def get_query_enhancer() -> LegalQueryEnhancer:
+    """Return the shared query enhancer, creating it on first use."""
+    global _query_enhancer
+    if _query_enhancer is None:
+        _query_enhancer = LegalQueryEnhancer()
+    return _query_enhancer
+
+
+def get_llm() -> ChatOpenAI:
+    """Return the shared chat model client, creating it on first use."""
+    global _llm
+    if _llm is None:
+        _llm = ChatOpenAI(model=CHAT_MODEL, temperature=0)
+    return _llm
+
+
+def get_citation_resolver() -> CitationResolver:
+    """Return the shared citation resolver, creating it on first use."""
+    global _citation_resolver
+    if _citation_resolver is None:
+        _citation_resolver = CitationResolver(INDEX_DIR)
+    return _citation_resolver
+
+
+def get_metadata_index(project: str) -> MetadataIndex:
+    """Return the shared metadata index for a project, loading it on first use."""
+    metadata_index = _metadata_indexes.get(project)
+    if metadata_index is None:
+        metadata_index = _metadata_indexes[project] = MetadataIndex(INDEX_DIR / project)
+    return metadata_index
+
+
 class LegalQueryRequest(BaseModel):
     """Request model for legal queries."""
     question: str = Field(..., description="The legal question to answer")
@@ -117,8 +169,8 @@ async def ask(
     project_list = [p.strip() for p in projects.split(",")]
     
     # Create hybrid chain for better case number handling
-    llm = ChatOpenAI(model=CHAT_MODEL, temperature=0)
-    enhancer = LegalQueryEnhancer()
+    llm = get_llm()
+    enhancer = get_query_enhancer()
     query_info = enhancer.enhance_query(q)
     prompt = create_legal_prompt_template(query_info['query_type'])
     rag_chain = create_hybrid_retrieval_chain(project_list, INDEX_DIR, llm, prompt)
@@ -139,11 +191,11 @@ async def legal_query(request: LegalQueryRequest):
     """Advanced legal query with full analysis."""
     try:
         # 1. Query enhancement
-        enhancer = LegalQueryEnhancer()
+        enhancer = get_query_enhancer()
         query_info = enhancer.enhance_query(request.question)
         
         # 2. Create hybrid retrieval chain for better case number handling
-        llm = ChatOpenAI(model=CHAT_MODEL, temperature=0)
+        llm = get_llm()
         prompt = create_legal_prompt_template(query_info['query_type'])
         rag_chain = create_hybrid_retrieval_chain(request.projects, INDEX_DIR, llm, prompt)
         
@@ -160,12 +212,12 @@ async def legal_query(request: LegalQueryRequest):
         citations_dict = None
         
         if request.include_citations:
-            resolver = CitationResolver(INDEX_DIR)
+            resolver = get_citation_resolver()
             enhancer = CitationEnhancer(resolver)
             answer = enhancer.enhance_response(answer, request.projects)
             
             # Extract resolved citations
-            processor = LegalDocumentProcessor()
+            processor = get_legal_processor()
             found_citations = processor.extract_citations(answer)
             citations_dict = {}
             for cit_type, cit_list in found_citations.items():
@@ -216,7 +268,7 @@ async def legal_query(request: LegalQueryRequest):
 async def citation_lookup(request: CitationLookupRequest):
     """Look up a specific citation."""
     try:
-        resolver = CitationResolver(INDEX_DIR)
+        resolver = get_citation_resolver()
         
         # Resolve the citation
         doc = resolver.resolve_citation(request.citation, request.projects)
@@ -259,7 +311,7 @@ async def metadata_search(request: MetadataSearchRequest):
         if not proj_dir.exists():
             raise HTTPException(status_code=404, detail=f"Project '{request.project}' not found")
         
-        metadata_index = MetadataIndex(proj_dir)
+        metadata_index = get_metadata_index(request.project)
         
         # Build search criteria
         criteria = {}
@@ -289,8 +341,9 @@ async def metadata_search(request: MetadataSearchRequest):
                     filtered_results.append(result)
             results = filtered_results
         
-        # Format response
-        return {
+        # Format response. Every value is already JSON-ready, so return
+        # the response directly rather than walking it with the encoder.
+        return _ResponseClass({
             "total_results": len(results),
             "documents": [
                 {
@@ -304,12 +357,23 @@ async def metadata_search(request: MetadataSearchRequest):
                 }
                 for r in results[:50]  # Limit to 50 results
             ]
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/admin/reload")
+async def reload_indexes():
+    """Drop cached index state so the next request sees rebuilt indexes."""
+    global _citation_resolver
+    _citation_resolver = None
+    _metadata_indexes.clear()
+    clear_db_cache()
+    clear_collection_cache()
+    return {"reloaded": True}
+
+
 @app.get("/projects")
 async def list_projects():
     """List all available projects."""
@@ -350,7 +414,7 @@ async def project_statistics(project: str):
         if not proj_dir.exists():
             raise HTTPException(status_code=404, detail=f"Project '{project}' not found")
         
-        metadata_index = MetadataIndex(proj_dir)
+        metadata_index = get_metadata_index(project)
         stats = metadata_index.get_statistics()
         
         # Add project name
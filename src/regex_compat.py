@@ -0,0 +1,256 @@
+"""Regex compilation with optional google-re2 acceleration.
+
+google-re2 is an optional, linear-time drop-in for the metadata and
+citation scans. RE2's ``\\s``, ``\\d``, ``\\w`` and ``\\b`` are ASCII-only and
+its IGNORECASE does not fold "i" with "İ"/"ı" the way ``re`` does, so a
+pattern handed to it unchanged stops matching around the non-breaking
+spaces and other non-ASCII characters common in PDF text.
+:func:`compile_pattern` therefore translates each pattern into RE2 syntax
+with exactly the stdlib meaning (shorthand classes are spelled out as the
+code points ``re`` itself matches) and uses the stdlib engine for any
+pattern containing a construct it cannot translate exactly: word
+boundaries, lookarounds, backreferences, a ``$`` outside MULTILINE mode,
+non-ASCII letters under IGNORECASE, and so on.
+
+RE2 works on UTF-8, so searching text that contains lone surrogates with
+an RE2 pattern raises ``UnicodeEncodeError``; text decoded from files
+never contains them.
+"""
+
+from __future__ import annotations
+import re
+from typing import Dict, List, Optional
+
+try:
+    import re2
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+except ImportError:
+    re2 = None
+
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+_SUPPORTED_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+
+# Escapes for control characters, spelled as code points for RE2
+_CONTROL_ESCAPES = {'a': 0x07, 'f': 0x0c, 'n': 0x0a, 'r': 0x0d, 't': 0x09, 'v': 0x0b}
+# Letters that, under IGNORECASE, ``re`` also matches with dotted capital I
+# and dotless i, which RE2 does not
+_DOTTED_I = (0x130, 0x131)
+_VALID_REPEAT = re.compile(r'\{(?:\d+(?:,\d*)?|,\d+)\}')
+
+# Code point ranges of \s, \d and \w as ``re`` matches them, computed on
+# first use
+_CLASS_RANGES: Dict[str, str] = {}
+
+
+class _Untranslatable(Exception):
+    """The pattern uses a construct RE2 cannot match exactly like ``re``."""
+
+
+def compile_pattern(pattern: str, flags: int = 0):
+    """Compile a pattern with RE2 when it matches exactly as ``re`` would.
+
+    Falls back to ``re.compile`` when google-re2 is not installed or the
+    pattern cannot be translated without changing its matches.
+    """
+    if re2 is not None:
+        translated = _to_re2(pattern, flags)
+        if translated is not None:
+            try:
+                return re2.compile(translated, _RE2_OPTIONS)
+            except re2.error:
+                pass
+    return re.compile(pattern, flags)
+
+
+def _to_re2(pattern: str, flags: int) -> Optional[str]:
+    """Translate a stdlib pattern to RE2 syntax, or None if not exactly possible."""
+    if flags & ~_SUPPORTED_FLAGS:
+        return None
+    try:
+        body = _Translator(pattern, flags).translate()
+    except _Untranslatable:
+        return None
+    inline = ''.join(letter for flag, letter in _RE2_INLINE_FLAGS if flags & flag)
+    return f'(?{inline}){body}' if inline else body
+
+
+def _class_ranges(letter: str) -> str:
+    """RE2 class body for the code points ``re`` matches with ``\\<letter>``."""
+    ranges = _CLASS_RANGES.get(letter)
+    if ranges is None:
+        everything = ''.join(map(chr, range(0xD800))) + ''.join(map(chr, range(0xE000, 0x110000)))
+        parts = []
+        for run in re.finditer(f'\\{letter}+', everything):
+            first, last = ord(run.group()[0]), ord(run.group()[-1])
+            parts.append(_code_range(first, last))
+        ranges = _CLASS_RANGES[letter] = ''.join(parts)
+    return ranges
+
+
+def _code_range(first: int, last: int) -> str:
+    if first == last:
+        return f'\\x{{{first:x}}}'
+    return f'\\x{{{first:x}}}-\\x{{{last:x}}}'
+
+
+class _Translator:
+    """Single-pass translator from ``re`` syntax to equivalent RE2 syntax."""
+
+    def __init__(self, pattern: str, flags: int):
+        self.pattern = pattern
+        self.pos = 0
+        self.ignorecase = bool(flags & re.IGNORECASE)
+        self.multiline = bool(flags & re.MULTILINE)
+
+    def translate(self) -> str:
+        out: List[str] = []
+        pattern = self.pattern
+        while self.pos < len(pattern):
+            char = pattern[self.pos]
+            self.pos += 1
+            if char == '\\':
+                out.append(self._escape())
+            elif char == '[':
+                out.append(self._char_class())
+            elif char == '(':
+                out.append(self._group())
+            elif char == '$':
+                # Without MULTILINE, re's $ also matches before a final newline
+                if not self.multiline:
+                    raise _Untranslatable
+                out.append(char)
+            elif char == '{':
+                repeat = _VALID_REPEAT.match(pattern, self.pos - 1)
+                if repeat:
+                    # RE2 needs the lower bound that re lets {,n} omit
+                    out.append(repeat.group().replace('{,', '{0,'))
+                    self.pos = repeat.end()
+                else:
+                    out.append('\\{')
+            elif char in 'iI' and self.ignorecase:
+                out.append(self._format_class(False, [(ord('i'), ord('i'))]))
+            elif not char.isascii() and self.ignorecase and char.lower() != char.upper():
+                raise _Untranslatable
+            else:
+                out.append(char)
+        return ''.join(out)
+
+    def _escape(self) -> str:
+        """Translate the escape after a backslash outside a class."""
+        char = self._next()
+        if char in 'sdw':
+            body = f'[{_class_ranges(char)}]'
+            return f'(?-i:{body})' if char == 'w' else body
+        if char in 'SDW':
+            body = f'[^{_class_ranges(char.lower())}]'
+            return f'(?-i:{body})' if char == 'W' else body
+        if char == 'A':
+            return '\\A'
+        if char == 'Z':
+            return '\\z'
+        if char in _CONTROL_ESCAPES:
+            return _code_range(_CONTROL_ESCAPES[char], _CONTROL_ESCAPES[char])
+        if char.isascii() and char.isalnum():
+            # \b, \B, backreferences, \x, \u, \N{...} and the like
+            raise _Untranslatable
+        if self.ignorecase and char.lower() != char.upper():
+            raise _Untranslatable
+        return _code_range(ord(char), ord(char))
+
+    def _group(self) -> str:
+        """Translate the opening of a group; only plain and named groups."""
+        pattern = self.pattern
+        if not pattern.startswith('?', self.pos):
+            return '('
+        if pattern.startswith('?:', self.pos):
+            self.pos += 2
+            return '(?:'
+        if pattern.startswith('?P<', self.pos):
+            end = pattern.find('>', self.pos)
+            if end == -1:
+                raise _Untranslatable
+            name = pattern[self.pos + 3:end]
+            self.pos = end + 1
+            return f'(?P<{name}>'
+        # Lookarounds, backreferences, comments and inline flags
+        raise _Untranslatable
+
+    def _char_class(self) -> str:
+        """Translate a character class, spelling every member as a code point."""
+        pattern = self.pattern
+        negated = pattern.startswith('^', self.pos)
+        if negated:
+            self.pos += 1
+        ranges = []
+        shorthands = []
+        first = True
+        while True:
+            if self.pos >= len(pattern):
+                raise _Untranslatable
+            char = pattern[self.pos]
+            if char == ']' and not first:
+                self.pos += 1
+                break
+            first = False
+            self.pos += 1
+            if char == '\\':
+                escaped = self._next()
+                if escaped in 'sdw':
+                    shorthands.append(escaped)
+                    continue
+                if escaped in _CONTROL_ESCAPES:
+                    low = _CONTROL_ESCAPES[escaped]
+                elif escaped.isascii() and escaped.isalnum():
+                    # \S, \D, \W, \b (backspace here) and numeric escapes
+                    raise _Untranslatable
+                else:
+                    low = ord(escaped)
+            elif char == '[':
+                # re warns about nested sets; RE2 reads [: as a POSIX class
+                raise _Untranslatable
+            else:
+                low = ord(char)
+            high = low
+            if (pattern.startswith('-', self.pos)
+                    and self.pos + 1 < len(pattern) and pattern[self.pos + 1] != ']'):
+                self.pos += 1
+                end_char = self._next()
+                if end_char == '\\':
+                    escaped = self._next()
+                    if escaped in _CONTROL_ESCAPES:
+                        high = _CONTROL_ESCAPES[escaped]
+                    elif escaped.isascii() and escaped.isalnum():
+                        raise _Untranslatable
+                    else:
+                        high = ord(escaped)
+                elif end_char == '[':
+                    raise _Untranslatable
+                else:
+                    high = ord(end_char)
+                if high < low:
+                    raise _Untranslatable
+            ranges.append((low, high))
+        if shorthands and self.ignorecase and 'w' in shorthands:
+            # Case variants RE2 would add to \w (e.g. U+0345) are not \w in re
+            raise _Untranslatable
+        if self.ignorecase:
+            for low, high in ranges:
+                if high >= 0x80 and any(chr(c).lower() != chr(c).upper()
+                                        for c in range(max(low, 0x80), high + 1)):
+                    raise _Untranslatable
+        return self._format_class(negated, ranges, shorthands)
+
+    def _format_class(self, negated: bool, ranges, shorthands=()) -> str:
+        members = [_code_range(low, high) for low, high in ranges]
+        members.extend(_class_ranges(letter) for letter in shorthands)
+        if self.ignorecase and any(low <= ord(c) <= high for low, high in ranges for c in 'iI'):
+            members.extend(_code_range(c, c) for c in _DOTTED_I)
+        return f"[{'^' if negated else ''}{''.join(members)}]"
+
+    def _next(self) -> str:
+        if self.pos >= len(self.pattern):
+            raise _Untranslatable
+        char = self.pattern[self.pos]
+        self.pos += 1
+        return char
@@ -4,14 +4,14 @@
 import json
 from pathlib import Path
 import docx
-from src.comprehensive_processor import ComprehensiveADREProcessor
+from src.comprehensive_processor import ComprehensiveADRECase, get_processor
 
 def test_comprehensive_extraction():
     """Test comprehensive metadata extraction on sample documents."""
     print("TESTING COMPREHENSIVE ADRE PROCESSOR")
     print("=" * 60)
     
-    processor = ComprehensiveADREProcessor()
+    processor = get_processor()
     case_dir = Path("../azoah/adre_decisions_downloads")
     
     # Test on 3 sample documents
@@ -75,5 +75,46 @@ def test_comprehensive_extraction():
     
     print(f"\n✓ Comprehensive processor test complete!")
 
+def test_classify_document_with_ligatures():
+    """Ligatures from PDF text still classify ("\ufb01" uppercases to "FI")."""
+    processor = get_processor()
+    for text, expected in [
+        ("The \ufb01nal order is here", "final_order"),
+        ("\ufb01ndings of fact", "findings_of_fact"),
+        ("FINAL ORDER", "final_order"),
+        ("nothing to see", "unknown"),
+    ]:
+        case = ComprehensiveADRECase(case_number="test")
+        processor._classify_document(case, text)
+        assert case.document_type == expected, (text, case.document_type)
+
+def test_party_name_after_long_lead_in():
+    """A sentence too long to be a name yields no fragment of its tail."""
+    text = (
+        "The parties were told that the meetings at issue in this matter were not open "
+        "to the public and that the board would not discuss her appeal in closing, "
+        "Respondent.\n"
+        "Sunset Ridge HOA manages the community.\n"
+    )
+    case = get_processor().extract_comprehensive_metadata(text, "x.docx")
+    assert case.hoa_name == "Sunset Ridge"
+    assert case.respondent_name == "Sunset Ridge Homeowners Association"
+
+def test_extract_batch_matches_serial_extraction():
+    """extract_batch pickles the processor and keeps input order."""
+    processor = get_processor()
+    docs = [
+        ("Sunset Ridge HOA, Respondent.\nADMINISTRATIVE LAW JUDGE DECISION\n"
+         "The Petition is denied.", "21F-H2121034-REL.docx"),
+        ("COMMISSIONER'S FINAL ORDER\nPower Ranch Homeowners Association\n"
+         "A.R.S. \u00a7 33-1803", "22A-H001-RHG.docx"),
+    ]
+    serial = [processor.extract_comprehensive_metadata(text, name) for text, name in docs]
+    assert processor.extract_batch(docs, max_workers=1) == serial
+    assert processor.extract_batch([]) == []
+
 if __name__ == "__main__":
-    test_comprehensive_extraction()
\ No newline at end of file
+    test_comprehensive_extraction()
+    test_classify_document_with_ligatures()
+    test_party_name_after_long_lead_in()
+    test_extract_batch_matches_serial_extraction()
\ No newline at end of file
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Test case-number matching in the hybrid retriever."""
+
+from src.hybrid_retriever import clear_collection_cache, find_case_chunks
+
+
+class InMemoryCollection:
+    """The slice of a Chroma collection that find_case_chunks reads."""
+
+    id = "test-collection"
+
+    def __init__(self, metadatas):
+        self.metadatas = metadatas
+
+    def count(self):
+        return len(self.metadatas)
+
+    def get(self, include=None):
+        return {
+            'ids': [f"chunk-{i}" for i in range(len(self.metadatas))],
+            'metadatas': self.metadatas,
+        }
+
+
+def test_rehearing_case_number_matches_its_own_file():
+    """A -REL-RHG number matches its file even though the stripped key does not."""
+    clear_collection_cache()
+    collection = InMemoryCollection([
+        {'source': '21A-H001-REL-RHG.pdf', 'chunk_priority': 2},
+        {'source': '21A-H001-RHG.pdf', 'chunk_priority': 1},
+        {'source': '22B-H002-REL.pdf', 'chunk_priority': 1},
+    ])
+    case_number = '21A-H001-REL-RHG'
+
+    ids = find_case_chunks(collection, (case_number, case_number.replace('-REL', '')))
+
+    assert ids == ['chunk-1', 'chunk-0']
+
+
+def test_rel_case_number_matches_sources_without_suffix():
+    """A -REL number also matches sources named without the suffix."""
+    clear_collection_cache()
+    collection = InMemoryCollection([
+        {'source': '21A-H001.pdf', 'chunk_priority': 3},
+        {'source': '21a-h001-rel.pdf', 'chunk_priority': 1},
+        {'source': 'other.pdf', 'case_number': '21A-H001-REL', 'chunk_priority': 2},
+    ])
+    case_number = '21A-H001-REL'
+
+    ids = find_case_chunks(collection, (case_number, '21A-H001'), case_number)
+
+    assert ids == ['chunk-1', 'chunk-2', 'chunk-0']
+
+
+if __name__ == "__main__":
+    test_rehearing_case_number_matches_its_own_file()
+    test_rel_case_number_matches_sources_without_suffix()
+    print("hybrid retriever tests passed")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Test MetadataIndex searches and that they follow changes to the index."""
+
+import tempfile
+from pathlib import Path
+
+from src.legal_metadata import LegalDocumentMetadata, MetadataIndex
+
+
+def make_document(sha256, document_type, statutes=(), cases=(), authority_weight=1):
+    return LegalDocumentMetadata(
+        file_path=f"/docs/{sha256}.pdf",
+        file_name=f"{sha256}.pdf",
+        sha256=sha256,
+        document_type=document_type,
+        statutes_cited=list(statutes),
+        cases_cited=list(cases),
+        authority_weight=authority_weight,
+    )
+
+
+def test_search_sees_added_readded_and_removed_documents():
+    with tempfile.TemporaryDirectory() as tmp:
+        index = MetadataIndex(Path(tmp))
+        index.add_document(make_document("a", "order", ["A.R.S. § 32-2153"]))
+        assert [m.sha256 for m in index.search(statutes_cited=["32-2153"])] == ["a"]
+
+        index.add_document(make_document("b", "order", ["A.R.S. § 32-2153"]))
+        assert [m.sha256 for m in index.search(statutes_cited=["32-2153"])] == ["a", "b"]
+
+        # A record changed in place is picked up once it is re-added
+        changed = index.get_by_sha256("a")
+        changed.statutes_cited.append("A.R.S. § 33-1803")
+        index.add_document(changed)
+        assert [m.sha256 for m in index.search(statutes_cited=["33-1803"])] == ["a"]
+
+        index.remove_document("b")
+        assert [m.sha256 for m in index.search(document_type="order")] == ["a"]
+
+
+def test_index_cannot_be_written_directly():
+    with tempfile.TemporaryDirectory() as tmp:
+        index = MetadataIndex(Path(tmp))
+        try:
+            index.index["a"] = make_document("a", "order")
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("MetadataIndex.index accepted a direct write")
+        assert index.search(document_type="order") == []
+
+
+def test_search_by_citation_prefix():
+    with tempfile.TemporaryDirectory() as tmp:
+        index = MetadataIndex(Path(tmp))
+        index.add_document(make_document("low", "order", ["A.R.S. § 32-2153"], authority_weight=2))
+        index.add_document(make_document("high", "statute", ["A.R.S. § 32-2101"], authority_weight=9))
+        # Two matching citations, one result
+        index.add_document(make_document(
+            "both", "order", ["A.R.S. § 32-2153", "A.R.S. § 32-2155"],
+            cases=["Smith v. Jones, 1 Ariz. 2"], authority_weight=5,
+        ))
+        index.add_document(make_document("other", "order", ["A.R.S. § 33-1803"]))
+
+        def lookup(prefix):
+            return [m.sha256 for m in index.search_by_citation_prefix(prefix)]
+
+        assert lookup("A.R.S. § 32-") == ["high", "both", "low"]
+        assert lookup("A.R.S. § 32-2153") == ["both", "low"]
+        assert lookup("Smith v.") == ["both"]
+        assert lookup("A.R.S. § 34-") == []
+        assert lookup("Z") == []
+
+        # The sorted citations are rebuilt after the documents change
+        index.add_document(make_document("new", "order", ["A.R.S. § 34-101"]))
+        assert lookup("A.R.S. § 34-") == ["new"]
+        index.remove_document("high")
+        assert lookup("A.R.S. § 32-") == ["both", "low"]
+
+
+if __name__ == "__main__":
+    test_search_sees_added_readded_and_removed_documents()
+    test_index_cannot_be_written_directly()
+    test_search_by_citation_prefix()
+    print("legal metadata tests passed")
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Test case information extraction in the enhanced legal processor."""
+
+from src.legal_processor_v2 import EnhancedLegalProcessor
+
+
+def test_judge_name_starting_in_lower_case_is_title_cased():
+    """The IGNORECASE judge patterns can capture a lower-case first name."""
+    processor = EnhancedLegalProcessor()
+    cases = [
+        ("Judge: velva Moses-Thompson\n", "Velva Moses"),
+        ("Judge: de la Cruz Maria", "De La Cruz Maria"),
+        ("ALJ: THOMAS SHEDDEN\n", "Thomas Shedden"),
+        ("ALJ: Ronald McDonald\n", "Ronald McDonald"),
+    ]
+    for text, expected in cases:
+        assert processor.extract_case_info(text, "x.pdf").judge_name == expected, text
+
+
+def test_extract_case_info_batch_matches_serial_extraction():
+    """extract_case_info_batch pickles the processor and keeps input order."""
+    processor = EnhancedLegalProcessor()
+    items = [
+        ("ADRE Case No. 21F-H2121034-REL\nALJ: Thomas Shedden\n"
+         "IT IS HEREBY ORDERED that the license is revoked.", "21F-H2121034-REL.pdf"),
+        ("OAH Docket No. 22A-H001\nJohn Smith, Respondent\nLicense No. SA123456",
+         "22A-H001.pdf"),
+    ]
+    serial = [processor.extract_case_info(text, filename) for text, filename in items]
+    assert processor.extract_case_info_batch(items, max_workers=1) == serial
+
+
+if __name__ == "__main__":
+    test_judge_name_starting_in_lower_case_is_title_cased()
+    test_extract_case_info_batch_matches_serial_extraction()
+    print("legal processor v2 tests passed")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Test that patterns compiled for RE2 keep their stdlib meaning."""
+
+import re
+
+from src.regex_compat import _to_re2, compile_pattern
+
+
+def test_shorthand_classes_match_unicode_text():
+    """\\s, \\d and \\w still match the non-ASCII characters PDFs contain."""
+    assert compile_pattern(r'pro\s+se', re.IGNORECASE).search('appearing pro\xa0se')
+    assert compile_pattern(r'\d+').search('No. ٣٤').group() == '٣٤'
+    assert compile_pattern(r'\w+').search('José').group() == 'José'
+
+
+def test_ignorecase_i_matches_dotted_and_dotless_i():
+    """re folds i with U+0130 and U+0131 under IGNORECASE; so must RE2."""
+    pattern = compile_pattern(r'findings', re.IGNORECASE)
+    assert pattern.search('FİNDİNGS')
+    assert pattern.search('fındıngs')
+
+
+def test_untranslatable_patterns_stay_on_stdlib():
+    """Constructs RE2 cannot match exactly like re are not translated."""
+    for pattern, flags in (
+        (r'\bcase\b', 0),
+        (r'(?=[A-Z])\w+', 0),
+        (r'order$', 0),
+        (r'café', re.IGNORECASE),
+        (r'[\w]+', re.IGNORECASE),
+        (r'(a)\1', 0),
+    ):
+        assert _to_re2(pattern, flags) is None, pattern
+
+
+def test_translation_keeps_groups_and_repeats():
+    translated = _to_re2(r'(?P<num>\d{1,3}(?:,\d{3})*)x{,2}', 0)
+    assert translated.startswith('(?P<num>[')
+    assert translated.endswith('x{0,2}')
+
+
+if __name__ == "__main__":
+    test_shorthand_classes_match_unicode_text()
+    test_ignorecase_i_matches_dotted_and_dotless_i()
+    test_untranslatable_patterns_stay_on_stdlib()
+    test_translation_keeps_groups_and_repeats()
+    print("regex compat tests passed")